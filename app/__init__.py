@@ -1,5 +1,6 @@
 import os
 import logging
+import threading
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -7,7 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import socketio
 
 from app import config
-from app.state import monitor_config, tts_config
+from app.state import monitor_config, tts_config, JsonBackedConfig
 from app.services.watcher import watcher_service
 from app.services.tts import TTSProcessor
 
@@ -42,7 +43,9 @@ def create_app() -> socketio.ASGIApp:
         # Auto-initialize default engine on startup
         logger.info(f"[Lifespan] Initializing default TTS engine ({tts_config.engine})...")
         try:
-            tts_manager.switch_engine(tts_config.engine)
+            engine = tts_manager.switch_engine(tts_config.engine)
+            # Load the model off the event loop so the first TTS request doesn't pay for it
+            threading.Thread(target=engine.warmup, name='tts-warmup', daemon=True).start()
         except Exception as e:
             logger.error(f"[Lifespan] Failed to auto-initialize TTS engine: {e}")
         
@@ -70,6 +73,7 @@ def create_app() -> socketio.ASGIApp:
         await app.state.tts_processor.stop()
         if not config.IS_PLUGIN_MODE:
             await watcher_service.stop()
+        JsonBackedConfig.flush_all()
 
     app = FastAPI(lifespan=lifespan)
 
@@ -39,6 +39,10 @@ FASTAPI_PORT = 5149 # Standalone Port
 # JSON backup log settings
 BACKUP_LOG_ENABLED = True
 
+# In-memory message history caps (oldest entries are dropped)
+RECENT_MSG_CAP = 2000
+TTS_MSG_CAP = 1000
+
 # Mode Flag (Set by main.py)
 IS_PLUGIN_MODE = False
 
@@ -4,6 +4,7 @@ import time
 from pathlib import Path
 import json
 import logging
+from itertools import islice
 
 from app import config
 from app.models import (
@@ -152,6 +153,44 @@ async def test_tts(data: Dict[str, Any]):
         logger.error(f"TTS Test Global Error: {e}")
         return Response(content=json.dumps({"success": False, "error": str(e)}), status_code=500, media_type="application/json")
 
+@router.post("/tts/test_stream")
+def test_tts_stream(data: Dict[str, Any]):
+    """Like /tts/test, but streams the WAV as it is synthesized.
+
+    A plain def so FastAPI runs it in the threadpool: priming the stream below
+    can load the model and runs the first synthesis, which must not block the event loop.
+    """
+    from tts_engines.manager import tts_manager
+    from fastapi.responses import Response, StreamingResponse
+
+    logger = logging.getLogger('biliutility.config')
+    engine_type = data.get('engine', tts_config.engine)
+    voice = data.get('voice', tts_config.voice)
+    speed = data.get('speed', tts_config.speed_normal)
+    text = data.get('text', "你好，这是一个测试。")
+
+    if not tts_manager.is_engine_available(engine_type):
+        msg = f"Engine {engine_type} is not available (Missing credentials or package)"
+        logger.error(msg)
+        return Response(content=json.dumps({"success": False, "error": msg}), status_code=400, media_type="application/json")
+
+    try:
+        current_engine = tts_manager.switch_engine(engine_type)
+        stream = current_engine.generate_audio_stream(text, voice, speed)
+        # Streams open with the WAV header, so also pull the first audio chunk: model load and
+        # synthesis errors surface here as a 500 instead of a truncated WAV after a 200
+        head = [next(stream)]
+        head.extend(islice(stream, 1))
+    except Exception as e:
+        logger.error(f"TTS Stream Error: {e}")
+        return Response(content=json.dumps({"success": False, "error": str(e)}), status_code=500, media_type="application/json")
+
+    def body():
+        yield from head
+        yield from stream
+
+    return StreamingResponse(body(), media_type="audio/wav")
+
 # Gift Config
 @router.get("/get_gift_config")
 @router.get("/gifts/get_config")
@@ -319,7 +358,7 @@ async def get_member_progress_config():
 @router.post("/members_progress/config")
 async def save_member_progress_config(data: Dict[str, Any]):
     # Using generic dict for now as model might be complex
-    member_progress_config.update(**data)
+    await member_progress_config.update_async(**data)
     await sio.emit('members_progress:config_updated', member_progress_config.get_config())
     return {"success": True}
 
@@ -1,5 +1,7 @@
+import asyncio
 import socketio
 import logging
+from typing import Optional
 from app.state import state, voting_config, monitor_config
 
 logger = logging.getLogger('biliutility.sockets')
@@ -71,35 +73,45 @@ def _build_tts_payload(msg):
         payload['amount'] = msg.content['amount']
     return payload
 
-async def broadcast_message(msg):
-    """Broadcast message events to widgets based on type"""
-    # Get current state snapshot
-    current_state = await state.get_state() if hasattr(state, 'get_state') else {
-        'paid_gift_total_value': state.paid_gift_total_value,
-        'paid_gift_count': state.paid_gift_count,
+# Paid gifts arrive in bursts; their counter updates are coalesced into one emit per window
+PAID_GIFT_BROADCAST_WINDOW = 0.05
+_pending_gift = None
+_pending_gift_count = 0
+_gift_flush_task: Optional[asyncio.Task] = None
+
+async def _flush_paid_gifts():
+    """Emit one paid_gift event carrying the latest totals for every gift seen in the window"""
+    global _pending_gift, _pending_gift_count, _gift_flush_task
+    await asyncio.sleep(PAID_GIFT_BROADCAST_WINDOW)
+    msg, count = _pending_gift, _pending_gift_count
+    _pending_gift, _pending_gift_count, _gift_flush_task = None, 0, None
+
+    payload = {
+        'total_value': state.paid_gift_total_value,
+        'total_count': state.paid_gift_count,
         'milestone_progress': state.milestone_progress,
         'milestone_count': state.milestone_count,
-        'total_guard_count': state.total_guard_count
+        'username': msg.username,
+        'gift_name': msg.content.get('gift_name'),
+        'quantity': msg.content.get('quantity'),
+        'value': msg.content.get('value'),
+        'batched_count': count
     }
-    
-    # Check direct attribute access vs get_state method (WidgetState usually has attributes)
+    await sio.emit('paid_gift', payload)
+
+async def broadcast_message(msg):
+    """Broadcast message events to widgets based on type"""
+    global _pending_gift, _pending_gift_count, _gift_flush_task
     logger.info(f"[Socket] Broadcasting event: {msg.type} for {msg.unique_id}")
     
     # Normalize type to string for comparison
     msg_type_str = msg.type.value if hasattr(msg.type, 'value') else str(msg.type)
     
     if msg_type_str == 'paid_gift':
-        payload = {
-            'total_value': state.paid_gift_total_value,
-            'total_count': state.paid_gift_count,
-            'milestone_progress': state.milestone_progress,
-            'milestone_count': state.milestone_count,
-            'username': msg.username,
-            'gift_name': msg.content.get('gift_name'),
-            'quantity': msg.content.get('quantity'),
-            'value': msg.content.get('value')
-        }
-        await sio.emit('paid_gift', payload)
+        _pending_gift = msg
+        _pending_gift_count += 1
+        if _gift_flush_task is None:
+            _gift_flush_task = asyncio.create_task(_flush_paid_gifts())
         
     elif msg_type_str == 'superchat':
         payload = {
@@ -38,6 +38,7 @@ class LogWatcherService:
                 await self.task
             except asyncio.CancelledError:
                 pass
+        state.file_tracker.flush()
         logger.info("[LogWatcher] Stopped")
 
     def _get_log_dir(self) -> str:
@@ -15,18 +15,13 @@ class WebhookService:
         Only triggers if webhooks are enabled for that specific tier.
         """
         # Check if enabled for this type
-        if webhook_type == 'captain' and not member_config.enable_webhook_captain:
-            return False
-        if webhook_type == 'admiral' and not member_config.enable_webhook_admiral:
-            return False
-        if webhook_type == 'governor' and not member_config.enable_webhook_governor:
+        if not member_config.webhook_enabled(webhook_type):
             return False
             
-        webhook_urls = credentials_manager.get_webhook_urls()
-        if webhook_type not in webhook_urls:
+        webhook_url = credentials_manager.get_webhook_url(webhook_type)
+        if webhook_url is None:
             return False
 
-        webhook_url = webhook_urls[webhook_type]
         if not webhook_url:
             logger.info(f"[Webhook] No URL configured for {webhook_type}")
             return False
@@ -4,57 +4,221 @@ import logging
 import threading
 import copy
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+import atexit
+import re
+from datetime import datetime
+from collections import namedtuple, deque, OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Mapping, ClassVar
 from pathlib import Path
 from cryptography.fernet import Fernet
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from app import config
 from app.models import MessageType, ParsedMessage
 
 logger = logging.getLogger('biliutility.state')
 
+def _freeze(value):
+    """Recursively convert dicts/lists into read-only mappingproxy/tuple equivalents"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _thaw(value):
+    """Inverse of _freeze: rebuild plain dicts/lists (JSON-serializable, mutable)"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+def _atomic_write_json(path: Path, data: dict, last_blob: Optional[bytes] = None) -> bytes:
+    """Serialize data as compact JSON in one buffer and atomically replace path with it.
+
+    Returns the serialized bytes; the write is skipped when they equal last_blob.
+    """
+    if orjson is not None:
+        blob = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=_thaw)
+    else:
+        blob = json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_thaw).encode('utf-8')
+    if blob == last_blob:
+        return blob
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
+    return blob
+
+def _read_json(path: Path):
+    """Parse a JSON file from a single bytes read"""
+    blob = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+def _clone_default(value):
+    """Fresh copy of a mutable default; frozen and scalar defaults are shared as-is"""
+    if isinstance(value, dict):
+        return {k: _clone_default(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone_default(v) for v in value]
+    return value
+
 # -------------------------
-# Configuration State Management
+# JSON-backed Configuration Base
 # -------------------------
-class ConfigState:
+class JsonBackedConfig:
+    """Base for config state persisted as one JSON file under DATA_PATH.
+
+    Subclasses declare FILENAME and DEFAULTS (persisted attribute -> default value).
+    Loading, saving and error reporting live here; _apply_config/_config_payload
+    are overridden only by fields that need custom (de)serialization.
+    Mutators call _mark_dirty so a burst of edits is written once per SAVE_DELAY;
+    on the event loop the write itself runs in a worker thread.
+    """
+    FILENAME: ClassVar[str] = ''
+    DEFAULTS: ClassVar[Dict[str, Any]] = {}
+    LOG_TAG: ClassVar[str] = 'Config'
+    SAVE_DELAY: ClassVar[float] = 0.2
+    _pending: ClassVar[set] = set()
+
     def __init__(self):
-        self.room_id = None
-        self.uid = None
-        self.username = None
-        self.log_dir = None
-        self.is_configured = False
         self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'bilibili_config.json'
+        self.config_file = Path(config.DATA_PATH) / self.FILENAME
+        self._last_saved_blob: Optional[bytes] = None
+        self._write_lock = threading.Lock()
+        self._save_seq = 0
+        self._written_seq = 0
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        for name, default in self.DEFAULTS.items():
+            setattr(self, name, _clone_default(default))
         self.load_config()
 
     def load_config(self):
         """Load config from JSON file if it exists"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.room_id = data.get('room_id')
-                    self.uid = data.get('uid')
-                    self.username = data.get('username')
-                    self.log_dir = data.get('log_dir')
-                    self.is_configured = data.get('is_configured', False)
-                logger.info(f"[Monitor Config] Loaded config - Room: {self.room_id}, User: {self.username}")
+                self._apply_config(_read_json(self.config_file))
         except Exception as e:
-            logger.error(f"[Monitor Config] Error loading config: {e}")
+            logger.error(f"[{self.LOG_TAG}] Error loading config: {e}")
 
     def save_config(self):
         """Save config to JSON file"""
+        self._write_payload(*self._build_payload())
+
+    async def save_config_async(self):
+        """Save config with the file write dispatched to a worker thread"""
+        await asyncio.to_thread(self._write_payload, *self._build_payload())
+
+    def _build_payload(self) -> Tuple[dict, int]:
+        """Detached copy of the persisted fields plus its save sequence number"""
+        with self.lock:
+            self._save_seq += 1
+            return _thaw(self._config_payload()), self._save_seq
+
+    def _write_payload(self, data: dict, seq: int):
+        with self._write_lock:
+            # A newer payload already reached disk; don't overwrite it with an older one
+            if seq <= self._written_seq:
+                return
+            try:
+                self._last_saved_blob = _atomic_write_json(self.config_file, data, self._last_saved_blob)
+                self._written_seq = seq
+            except Exception as e:
+                logger.error(f"[{self.LOG_TAG}] Error saving config: {e}")
+
+    def _mark_dirty(self):
+        """Schedule a coalesced save; saves immediately when called outside the event loop"""
         try:
-            data = {
-                'room_id': self.room_id,
-                'uid': self.uid,
-                'username': self.username,
-                'log_dir': self.log_dir,
-                'is_configured': self.is_configured
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[Monitor Config] Error saving config: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_config()
+            return
+        with self.lock:
+            self._dirty = True
+            JsonBackedConfig._pending.add(self)
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.SAVE_DELAY, self._flush_in_background, loop)
+
+    def _flush_in_background(self, loop: asyncio.AbstractEventLoop):
+        with self.lock:
+            self._flush_handle = None
+            JsonBackedConfig._pending.discard(self)
+            if not self._dirty:
+                return
+            self._dirty = False
+            data, seq = self._build_payload()
+        loop.run_in_executor(None, self._write_payload, data, seq)
+
+    async def flush_async(self):
+        """Write pending changes now without blocking the event loop"""
+        with self.lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            JsonBackedConfig._pending.discard(self)
+            if not self._dirty:
+                return
+            self._dirty = False
+        await self.save_config_async()
+
+    def flush_now(self):
+        """Write pending changes and cancel the scheduled save"""
+        with self.lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            JsonBackedConfig._pending.discard(self)
+            if self._dirty:
+                self._dirty = False
+                self.save_config()
+
+    @classmethod
+    def flush_all(cls):
+        """Write every config with pending changes (used at shutdown)"""
+        for cfg in list(JsonBackedConfig._pending):
+            cfg.flush_now()
+
+    def _apply_config(self, data: dict):
+        for name, default in self.DEFAULTS.items():
+            setattr(self, name, data[name] if name in data else _clone_default(default))
+
+    def _config_payload(self) -> dict:
+        return {name: getattr(self, name) for name in self.DEFAULTS}
+
+# -------------------------
+# Configuration State Management
+# -------------------------
+# Immutable view of ConfigState, swapped in whole on every write so readers need no lock
+_CfgSnap = namedtuple('_CfgSnap', 'room_id uid username log_dir is_configured')
+
+class ConfigState(JsonBackedConfig):
+    FILENAME = 'bilibili_config.json'
+    LOG_TAG = 'Monitor Config'
+    DEFAULTS = {
+        'room_id': None,
+        'uid': None,
+        'username': None,
+        'log_dir': None,
+        'is_configured': False
+    }
+
+    def __init__(self):
+        self._snap = _CfgSnap(None, None, None, None, False)
+        super().__init__()
+
+    def _publish(self):
+        self._snap = _CfgSnap(self.room_id, self.uid, self.username, self.log_dir, self.is_configured)
+
+    def _apply_config(self, data: dict):
+        super()._apply_config(data)
+        self._publish()
+        logger.info(f"[Monitor Config] Loaded config - Room: {self.room_id}, User: {self.username}")
 
     def set_config(self, room_id: str, uid: str, username: str, log_dir: Optional[str] = None):
         with self.lock:
@@ -63,7 +227,8 @@ class ConfigState:
             self.username = username
             self.log_dir = log_dir
             self.is_configured = True
-            self.save_config()
+            self._publish()
+            self._mark_dirty()
 
     def clear_config(self):
         with self.lock:
@@ -72,66 +237,39 @@ class ConfigState:
             self.username = None
             self.log_dir = None
             self.is_configured = False
-            self.save_config()
+            self._publish()
+            self._mark_dirty()
 
     def get_room_id(self, fallback: Optional[str] = None) -> Optional[str]:
         """Get configured room_id or fallback to default"""
-        with self.lock:
-            return self.room_id if self.is_configured else fallback
+        snap = self._snap
+        return snap.room_id if snap.is_configured else fallback
 
     def get_log_dir(self, fallback: Optional[str] = None) -> str:
         """Get configured log_dir or fallback to default"""
-        with self.lock:
-            return self.log_dir if (self.is_configured and self.log_dir) else fallback
+        snap = self._snap
+        return snap.log_dir if (snap.is_configured and snap.log_dir) else fallback
 
 # -------------------------
 # TTS Configuration State Management
 # -------------------------
-class TTSConfigState:
+class TTSConfigState(JsonBackedConfig):
     """Manages TTS engine, voice and speed configuration with JSON persistence"""
+    FILENAME = 'tts_config.json'
+    LOG_TAG = 'TTS Config'
     DEFAULT_SETTINGS = {
         'engine': 'kokoro',
         'voice': 'zm_yunjian',
         'speed_normal': 0.9,
         'speed_name': 0.8
     }
+    DEFAULTS = DEFAULT_SETTINGS
+    # Note: We don't initialize tts_manager here to avoid circular imports.
+    # Logic using tts_manager should be in service layer.
 
-    def __init__(self):
-        self.engine = self.DEFAULT_SETTINGS['engine']
-        self.voice = self.DEFAULT_SETTINGS['voice']
-        self.speed_normal = self.DEFAULT_SETTINGS['speed_normal']
-        self.speed_name = self.DEFAULT_SETTINGS['speed_name']
-        self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'tts_config.json'
-        # Note: We don't initialize tts_manager here to avoid circular imports.
-        # Logic using tts_manager should be in service layer.
-        self.load_config()
-
-    def load_config(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.engine = data.get('engine', self.DEFAULT_SETTINGS['engine'])
-                    self.voice = data.get('voice', self.DEFAULT_SETTINGS['voice'])
-                    self.speed_normal = data.get('speed_normal', self.DEFAULT_SETTINGS['speed_normal'])
-                    self.speed_name = data.get('speed_name', self.DEFAULT_SETTINGS['speed_name'])
-                logger.info(f"[TTS Config] Loaded config - Engine: {self.engine}, Voice: {self.voice}")
-        except Exception as e:
-            logger.error(f"[TTS Config] Error loading config, using defaults: {e}")
-
-    def save_config(self):
-        try:
-            data = {
-                'engine': self.engine,
-                'voice': self.voice,
-                'speed_normal': self.speed_normal,
-                'speed_name': self.speed_name
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
-        except Exception as e:
-            logger.error(f"[TTS Config] Error saving config: {e}")
+    def _apply_config(self, data: dict):
+        super()._apply_config(data)
+        logger.info(f"[TTS Config] Loaded config - Engine: {self.engine}, Voice: {self.voice}")
 
     def update(self, engine=None, voice=None, speed_normal=None, speed_name=None):
         """Update config values and save to file"""
@@ -144,37 +282,86 @@ class TTSConfigState:
                 self.speed_normal = float(speed_normal)
             if speed_name is not None:
                 self.speed_name = float(speed_name)
-            self.save_config()
+            self._mark_dirty()
 
 # -------------------------
 # Credentials Management
 # -------------------------
+# Fernet instances keyed by resolved key-file path, shared across CredentialsManager instances
+_KEY_CACHE: Dict[Path, Fernet] = {}
+
 class CredentialsManager:
     """Manages encrypted API credentials (AWS, DeepL)"""
+    _WEBHOOK_INDEX = {'captain': 0, 'admiral': 1, 'governor': 2}
+
     def __init__(self):
         self.key_file = Path(config.DATA_PATH) / '.secret.key'
         self.creds_file = Path(config.DATA_PATH) / 'credentials.json'
+        # rotate_key persists the new key here before re-encrypting anything with it
+        self.pending_key_file = self.key_file.with_suffix('.new')
+        self._finish_pending_rotation()
         self.fernet = self._load_or_generate_key()
         self.credentials = self.load_credentials()
         self._apply_to_env()
 
     def _load_or_generate_key(self):
         try:
+            key_path = self.key_file.resolve()
+            fernet = _KEY_CACHE.get(key_path)
+            if fernet is not None:
+                return fernet
             if self.key_file.exists():
                 key = self.key_file.read_bytes()
             else:
                 key = Fernet.generate_key()
                 self.key_file.write_bytes(key)
-            return Fernet(key)
+            fernet = _KEY_CACHE[key_path] = Fernet(key)
+            return fernet
         except Exception as e:
             logger.error(f"[Credentials] Error initializing encryption key: {e}")
             return Fernet(Fernet.generate_key())
 
+    def rotate_key(self):
+        """Replace the encryption key and re-encrypt stored credentials with it.
+
+        The new key is written to pending_key_file first, then credentials.json is
+        re-encrypted, then the pending key replaces key_file. If the process dies
+        in between, _finish_pending_rotation completes or undoes it on next start.
+        """
+        key = Fernet.generate_key()
+        fernet = Fernet(key)
+        tmp = self.pending_key_file.with_suffix('.tmp')
+        tmp.write_bytes(key)
+        os.replace(tmp, self.pending_key_file)
+        _atomic_write_json(self.creds_file, self._encrypt(self.credentials, fernet))
+        os.replace(self.pending_key_file, self.key_file)
+        self.fernet = _KEY_CACHE[self.key_file.resolve()] = fernet
+
+    def _finish_pending_rotation(self):
+        """Complete or roll back a rotate_key that was interrupted between its writes"""
+        if not self.pending_key_file.exists():
+            return
+        try:
+            new_fernet = Fernet(self.pending_key_file.read_bytes())
+            values = [v for v in _read_json(self.creds_file).values() if v] if self.creds_file.exists() else []
+            try:
+                if values:
+                    new_fernet.decrypt(values[0].encode())
+            except Exception:
+                # credentials.json was never re-encrypted, so the old key is still the right one
+                self.pending_key_file.unlink()
+                logger.warning("[Credentials] Rolled back interrupted key rotation")
+                return
+            os.replace(self.pending_key_file, self.key_file)
+            _KEY_CACHE.pop(self.key_file.resolve(), None)
+            logger.warning("[Credentials] Completed interrupted key rotation")
+        except Exception as e:
+            logger.error(f"[Credentials] Error recovering interrupted key rotation: {e}")
+
     def load_credentials(self):
         if self.creds_file.exists():
             try:
-                with open(self.creds_file, 'r', encoding='utf-8') as f:
-                    encrypted_data = json.load(f)
+                encrypted_data = _read_json(self.creds_file)
                 
                 decrypted_data = {}
                 for k, v in encrypted_data.items():
@@ -199,16 +386,20 @@ class CredentialsManager:
             "webhook_url_governor": ""
         }
 
-    def save_credentials(self, data):
+    @staticmethod
+    def _encrypt(data, fernet):
         encrypted_data = {}
         for k, v in data.items():
             if v:
-                encrypted_data[k] = self.fernet.encrypt(v.encode()).decode()
+                encrypted_data[k] = fernet.encrypt(v.encode()).decode()
             else:
                 encrypted_data[k] = ""
+        return encrypted_data
+
+    def save_credentials(self, data):
+        encrypted_data = self._encrypt(data, self.fernet)
         try:
-            with open(self.creds_file, 'w', encoding='utf-8') as f:
-                json.dump(encrypted_data, f, indent=4)
+            _atomic_write_json(self.creds_file, encrypted_data)
             self.credentials = data
             self._apply_to_env()
         except Exception as e:
@@ -220,81 +411,55 @@ class CredentialsManager:
         os.environ['AWS_SECRET_ACCESS_KEY'] = self.credentials.get('aws_secret_key', "")
         os.environ['AWS_REGION'] = self.credentials.get('aws_region', "us-east-1")
         os.environ['DEEPL_AUTH_KEY'] = self.credentials.get('deepl_auth_key', "")
+        self._webhook_urls = (
+            self.credentials.get('webhook_url_captain', ''),
+            self.credentials.get('webhook_url_admiral', ''),
+            self.credentials.get('webhook_url_governor', '')
+        )
+
+    def get_webhook_url(self, tier: str) -> Optional[str]:
+        """Get the webhook URL for a single tier, or None for an unknown tier"""
+        idx = self._WEBHOOK_INDEX.get(tier)
+        return self._webhook_urls[idx] if idx is not None else None
 
     def get_webhook_urls(self) -> dict:
+        captain, admiral, governor = self._webhook_urls
         return {
-            'captain': self.credentials.get('webhook_url_captain', ''),
-            'admiral': self.credentials.get('webhook_url_admiral', ''),
-            'governor': self.credentials.get('webhook_url_governor', '')
+            'captain': captain,
+            'admiral': admiral,
+            'governor': governor
         }
 
 # -------------------------
 # Gift Widget Configuration
 # -------------------------
-class GiftConfigState:
+class GiftConfigState(JsonBackedConfig):
+    FILENAME = 'gift_config.json'
+    LOG_TAG = 'Gift Config'
     DEFAULT_MILESTONE_GOAL = 500
     DEFAULT_TITLE = "惩罚轮盘进度"
-    DEFAULT_TITLE_STYLE = {
+    DEFAULT_TITLE_STYLE = _freeze({
         'type': 'solid', 'colors': ['#E8D57C'], 'angle': 90, 'glass_blur': 0,
         'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0
-    }
-    DEFAULT_BG_STYLE = {
+    })
+    DEFAULT_BG_STYLE = _freeze({
         'type': 'linear', 'colors': ['#9C6C8C', '#5A4F77'], 'angle': 135, 'glass_blur': 0,
         'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': 'rgba(255, 215, 0, 0)', 'border_width': 0
+    })
+    # Style defaults are frozen and shared; updates replace them wholesale
+    DEFAULTS = {
+        'milestone_goal': DEFAULT_MILESTONE_GOAL,
+        'title_text': DEFAULT_TITLE,
+        'title_style': DEFAULT_TITLE_STYLE,
+        'show_title': True,
+        'background_style': DEFAULT_BG_STYLE,
+        'show_background': True,
+        'count_color': '#E8D57C',
+        'label_color': 'rgba(255, 255, 255, 0.8)',
+        'progress_bar_start_color': '#E8D57C',
+        'progress_bar_end_color': '#C87041'
     }
 
-    def __init__(self):
-        self.milestone_goal = self.DEFAULT_MILESTONE_GOAL
-        self.title_text = self.DEFAULT_TITLE
-        self.title_style = copy.deepcopy(self.DEFAULT_TITLE_STYLE)
-        self.show_title = True
-        self.background_style = copy.deepcopy(self.DEFAULT_BG_STYLE)
-        self.show_background = True
-        self.count_color = '#E8D57C'
-        self.label_color = 'rgba(255, 255, 255, 0.8)'
-        self.progress_bar_start_color = '#E8D57C'
-        self.progress_bar_end_color = '#C87041'
-        self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'gift_config.json'
-        self.load_config()
-
-    def load_config(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.milestone_goal = data.get('milestone_goal', self.DEFAULT_MILESTONE_GOAL)
-                    self.title_text = data.get('title_text', self.DEFAULT_TITLE)
-                    self.title_style = data.get('title_style', copy.deepcopy(self.DEFAULT_TITLE_STYLE))
-                    self.show_title = data.get('show_title', True)
-                    self.background_style = data.get('background_style', copy.deepcopy(self.DEFAULT_BG_STYLE))
-                    self.show_background = data.get('show_background', True)
-                    self.count_color = data.get('count_color', '#E8D57C')
-                    self.label_color = data.get('label_color', 'rgba(255, 255, 255, 0.8)')
-                    self.progress_bar_start_color = data.get('progress_bar_start_color', '#E8D57C')
-                    self.progress_bar_end_color = data.get('progress_bar_end_color', '#C87041')
-        except Exception as e:
-            logger.error(f"[Gift Config] Error loading config: {e}")
-
-    def save_config(self):
-        try:
-            data = {
-                'milestone_goal': self.milestone_goal,
-                'title_text': self.title_text,
-                'title_style': self.title_style,
-                'show_title': self.show_title,
-                'background_style': self.background_style,
-                'show_background': self.show_background,
-                'count_color': self.count_color,
-                'label_color': self.label_color,
-                'progress_bar_start_color': self.progress_bar_start_color,
-                'progress_bar_end_color': self.progress_bar_end_color
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[Gift Config] Error saving config: {e}")
-
     def update(self, **kwargs):
         with self.lock:
             for k, v in kwargs.items():
@@ -303,7 +468,7 @@ class GiftConfigState:
                     # Handle type conversion if needed
                     if k == 'milestone_goal':
                          self.milestone_goal = int(v)
-            self.save_config()
+            self._mark_dirty()
             
     def get_milestone_goal(self) -> int:
         with self.lock:
@@ -311,90 +476,68 @@ class GiftConfigState:
 
     def get_config(self) -> dict:
         with self.lock:
-            return {
-                'milestone_goal': self.milestone_goal,
-                'title_text': self.title_text,
-                'title_style': self.title_style,
-                'show_title': self.show_title,
-                'background_style': self.background_style,
-                'show_background': self.show_background,
-                'count_color': self.count_color,
-                'label_color': self.label_color,
-                'progress_bar_start_color': self.progress_bar_start_color,
-                'progress_bar_end_color': self.progress_bar_end_color
-            }
+            return _thaw(self._config_payload())
 
 # -------------------------
 # Member Widget Configuration
 # -------------------------
-class MemberConfigState:
-    DEFAULT_GIFS = {
+# (attribute, coercion) pairs applied by MemberConfigState.update
+_MEMBER_FIELDS = (
+    ('show_member_info', bool),
+    ('thank_you_text', str),
+)
+
+# Bit per tier in MemberConfigState.webhook_mask; persisted as enable_webhook_<tier> booleans
+_TIER_BIT = {'captain': 1, 'admiral': 2, 'governor': 4}
+
+class MemberConfigState(JsonBackedConfig):
+    FILENAME = 'member_config.json'
+    LOG_TAG = 'Member Config'
+    DEFAULT_GIFS = _freeze({
         'captain': 'souris_captain.png',
         'admiral': 'souris_admiral.png',
         'governor': 'souris_governor.png'
-    }
+    })
     DEFAULT_THANK_YOU_TEXT = "感谢您加入舰队！"
-    DEFAULT_STYLES_PER_TIER = {
+    DEFAULT_STYLES_PER_TIER = _freeze({
         'bg_style': { 'type': 'solid', 'colors': ['rgba(50, 40, 80, 0.95)'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': 'rgba(100, 200, 255, 0.8)', 'border_width': 2 },
         'name_style': { 'type': 'solid', 'colors': ['#FFD700'], 'angle': 90, 'shadow_color': '#000000', 'shadow_size': 0 },
         'rank_style': { 'type': 'solid', 'colors': ['#87CEEB'], 'angle': 90, 'shadow_color': '#000000', 'shadow_size': 0 }
+    })
+    DEFAULTS = {
+        'custom_gifs': {},
+        'thank_you_text': DEFAULT_THANK_YOU_TEXT,
+        'show_member_info': True,
+        # Tiers share the frozen defaults until an update replaces them
+        'styles': {
+            'captain': DEFAULT_STYLES_PER_TIER,
+            'admiral': DEFAULT_STYLES_PER_TIER,
+            'governor': DEFAULT_STYLES_PER_TIER
+        }
     }
 
     def __init__(self):
-        self.custom_gifs = {}
-        self.thank_you_text = self.DEFAULT_THANK_YOU_TEXT
-        self.show_member_info = True
-        self.enable_webhook_captain = False
-        self.enable_webhook_admiral = False
-        self.enable_webhook_governor = False
-        self.styles = {
-            'captain': copy.deepcopy(self.DEFAULT_STYLES_PER_TIER),
-            'admiral': copy.deepcopy(self.DEFAULT_STYLES_PER_TIER),
-            'governor': copy.deepcopy(self.DEFAULT_STYLES_PER_TIER)
-        }
-        self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'member_config.json'
-        self.load_config()
-
-    def load_config(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.custom_gifs = data.get('custom_gifs', {})
-                    self.thank_you_text = data.get('thank_you_text', self.DEFAULT_THANK_YOU_TEXT)
-                    self.show_member_info = data.get('show_member_info', True)
-                    self.enable_webhook_captain = data.get('enable_webhook_captain', False)
-                    self.enable_webhook_admiral = data.get('enable_webhook_admiral', False)
-                    self.enable_webhook_governor = data.get('enable_webhook_governor', False)
-                    
-                    saved_styles = data.get('styles', {})
-                    if 'captain' in saved_styles or 'admiral' in saved_styles:
-                         for tier in ['captain', 'admiral', 'governor']:
-                            if tier in saved_styles:
-                                self.styles[tier] = saved_styles[tier]
-                    else:
-                        # Legacy support omitted for brevity, assuming migrated
-                         pass
-
-        except Exception as e:
-            logger.error(f"[Member Config] Error loading config: {e}")
-
-    def save_config(self):
-        try:
-            data = {
-                'custom_gifs': self.custom_gifs,
-                'thank_you_text': self.thank_you_text,
-                'show_member_info': self.show_member_info,
-                'enable_webhook_captain': self.enable_webhook_captain,
-                'enable_webhook_admiral': self.enable_webhook_admiral,
-                'enable_webhook_governor': self.enable_webhook_governor,
-                'styles': self.styles
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[Member Config] Error saving config: {e}")
+        self._gif_cache: Dict[str, str] = {}
+        self.webhook_mask = 0
+        super().__init__()
+
+    def _apply_config(self, data: dict):
+        styles = self.styles
+        super()._apply_config(data)
+        self._gif_cache.clear()
+
+        mask = 0
+        for tier, bit in _TIER_BIT.items():
+            if data.get(f'enable_webhook_{tier}'):
+                mask |= bit
+        self.webhook_mask = mask
+
+        # Saved styles only override the tiers they contain
+        self.styles = styles
+        saved_styles = data.get('styles', {})
+        for tier in ['captain', 'admiral', 'governor']:
+            if tier in saved_styles:
+                self.styles[tier] = saved_styles[tier]
 
     def update(self, **kwargs):
         with self.lock:
@@ -406,20 +549,31 @@ class MemberConfigState:
                 if tier in kwargs and isinstance(kwargs[tier], dict):
                     self.styles[tier] = kwargs[tier]
 
-            if 'show_member_info' in kwargs and kwargs['show_member_info'] is not None:
-                self.show_member_info = bool(kwargs['show_member_info'])
-            
-            if 'thank_you_text' in kwargs and kwargs['thank_you_text'] is not None:
-                self.thank_you_text = str(kwargs['thank_you_text'])
-
-            if 'enable_webhook_captain' in kwargs and kwargs['enable_webhook_captain'] is not None:
-                self.enable_webhook_captain = bool(kwargs['enable_webhook_captain'])
-            if 'enable_webhook_admiral' in kwargs and kwargs['enable_webhook_admiral'] is not None:
-                self.enable_webhook_admiral = bool(kwargs['enable_webhook_admiral'])
-            if 'enable_webhook_governor' in kwargs and kwargs['enable_webhook_governor'] is not None:
-                self.enable_webhook_governor = bool(kwargs['enable_webhook_governor'])
-                
-            self.save_config()
+            for name, coerce in _MEMBER_FIELDS:
+                value = kwargs.get(name)
+                if value is not None:
+                    setattr(self, name, coerce(value))
+
+            mask = self.webhook_mask
+            for tier, bit in _TIER_BIT.items():
+                value = kwargs.get(f'enable_webhook_{tier}')
+                if value is not None:
+                    mask = (mask | bit) if value else (mask & ~bit)
+            self.webhook_mask = mask
+
+            self._mark_dirty()
+
+    def _config_payload(self) -> dict:
+        data = super()._config_payload()
+        data.update(self._webhook_flags())
+        return data
+
+    def _webhook_flags(self) -> dict:
+        mask = self.webhook_mask
+        return {f'enable_webhook_{tier}': bool(mask & bit) for tier, bit in _TIER_BIT.items()}
+
+    def webhook_enabled(self, tier: str) -> bool:
+        return bool(self.webhook_mask & _TIER_BIT.get(tier, 0))
 
     def get_config(self) -> dict:
         with self.lock:
@@ -430,18 +584,22 @@ class MemberConfigState:
                 gifs[tier] = {'url': url, 'is_custom': is_custom}
             
             return {
-                'styles': copy.deepcopy(self.styles),
+                'styles': _thaw(self.styles),
                 'show_member_info': self.show_member_info,
                 'thank_you_text': self.thank_you_text,
-                'enable_webhook_captain': self.enable_webhook_captain,
-                'enable_webhook_admiral': self.enable_webhook_admiral,
-                'enable_webhook_governor': self.enable_webhook_governor,
+                **self._webhook_flags(),
                 'gifs': gifs
             }
     
     def get_gif(self, tier: str) -> str:
+        gif = self._gif_cache.get(tier)
+        if gif is not None:
+            return gif
         with self.lock:
-            return self.custom_gifs.get(tier, self.DEFAULT_GIFS.get(tier))
+            gif = self.custom_gifs.get(tier, self.DEFAULT_GIFS.get(tier))
+            if gif is not None:
+                self._gif_cache[tier] = gif
+            return gif
 
     def set_gif(self, tier: str, filename: str, is_custom: bool = True):
         with self.lock:
@@ -449,7 +607,8 @@ class MemberConfigState:
                 self.custom_gifs[tier] = filename
             elif tier in self.custom_gifs:
                 del self.custom_gifs[tier]
-            self.save_config()
+            self._gif_cache.pop(tier, None)
+            self._mark_dirty()
 
     def reset_gif(self, tier: str):
         self.set_gif(tier, "", is_custom=False)
@@ -457,67 +616,48 @@ class MemberConfigState:
 # -------------------------
 # Voting Configuration
 # -------------------------
-class VotingConfigState:
+# (attribute, coercion) pairs applied by VotingConfigState.update_styles; None keeps the value as sent
+_VOTING_STYLE_FIELDS = (
+    ('title', None),
+    ('title_style', None),
+    ('show_title', bool),
+    ('background_style', None),
+    ('show_background', bool),
+    ('option_style', None),
+    ('bar_bg_style', None),
+    ('bar_fill_style', None),
+    ('bar_text_style', None),
+)
+
+class VotingConfigState(JsonBackedConfig):
+    FILENAME = 'voting_config.json'
+    LOG_TAG = 'Voting Config'
     DEFAULT_TITLE = "Chat Voting"
-    DEFAULT_TITLE_STYLE = { 'type': 'linear', 'colors': ['#E8D57C', '#CAAD8E'], 'angle': 135, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 }
-    DEFAULT_BG_STYLE = { 'type': 'linear', 'colors': ['rgba(90, 79, 119, 0.8)', 'rgba(156, 108, 140, 0.8)'], 'angle': 135, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': 'rgba(255, 215, 0, 0.3)', 'border_width': 2 }
-    DEFAULT_OPTION_STYLE = { 'type': 'linear', 'colors': ['#E8D57C', '#CAAD8E'], 'angle': 135, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 }
-    DEFAULT_BAR_BG_STYLE = { 'type': 'solid', 'colors': ['rgba(0, 0, 0, 0.3)'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 }
-    DEFAULT_BAR_FILL_STYLE = { 'type': 'linear', 'colors': ['#3498db', '#D6EFFF'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 }
-    DEFAULT_BAR_TEXT_STYLE = { 'type': 'solid', 'colors': ['#ffffff'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 4, 'border_color': '#ffffff', 'border_width': 0 }
+    DEFAULT_TITLE_STYLE = _freeze({ 'type': 'linear', 'colors': ['#E8D57C', '#CAAD8E'], 'angle': 135, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 })
+    DEFAULT_BG_STYLE = _freeze({ 'type': 'linear', 'colors': ['rgba(90, 79, 119, 0.8)', 'rgba(156, 108, 140, 0.8)'], 'angle': 135, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': 'rgba(255, 215, 0, 0.3)', 'border_width': 2 })
+    DEFAULT_OPTION_STYLE = _freeze({ 'type': 'linear', 'colors': ['#E8D57C', '#CAAD8E'], 'angle': 135, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 })
+    DEFAULT_BAR_BG_STYLE = _freeze({ 'type': 'solid', 'colors': ['rgba(0, 0, 0, 0.3)'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 })
+    DEFAULT_BAR_FILL_STYLE = _freeze({ 'type': 'linear', 'colors': ['#3498db', '#D6EFFF'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 0, 'border_color': '#ffffff', 'border_width': 0 })
+    DEFAULT_BAR_TEXT_STYLE = _freeze({ 'type': 'solid', 'colors': ['#ffffff'], 'angle': 90, 'glass_blur': 0, 'glass_opacity': 1.0, 'shadow_color': '#000000', 'shadow_size': 4, 'border_color': '#ffffff', 'border_width': 0 })
+    DEFAULTS = {
+        'title': DEFAULT_TITLE,
+        'title_style': DEFAULT_TITLE_STYLE,
+        'show_title': True,
+        'background_style': DEFAULT_BG_STYLE,
+        'show_background': True,
+        'option_style': DEFAULT_OPTION_STYLE,
+        'bar_bg_style': DEFAULT_BAR_BG_STYLE,
+        'bar_fill_style': DEFAULT_BAR_FILL_STYLE,
+        'bar_text_style': DEFAULT_BAR_TEXT_STYLE
+    }
 
     def __init__(self):
-        self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'voting_config.json'
+        # Live voting session state is not persisted
         self.is_active = False
-        self.title = self.DEFAULT_TITLE
         self.options: List[str] = []
         self.vote_counts: List[int] = []
-        self.title_style = copy.deepcopy(self.DEFAULT_TITLE_STYLE)
-        self.show_title = True
-        self.background_style = copy.deepcopy(self.DEFAULT_BG_STYLE)
-        self.show_background = True
-        self.option_style = copy.deepcopy(self.DEFAULT_OPTION_STYLE)
-        self.bar_bg_style = copy.deepcopy(self.DEFAULT_BAR_BG_STYLE)
-        self.bar_fill_style = copy.deepcopy(self.DEFAULT_BAR_FILL_STYLE)
-        self.bar_text_style = copy.deepcopy(self.DEFAULT_BAR_TEXT_STYLE)
-        self.load_config()
-
-    def load_config(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.title = data.get('title', self.DEFAULT_TITLE)
-                    self.title_style = data.get('title_style', copy.deepcopy(self.DEFAULT_TITLE_STYLE))
-                    self.show_title = data.get('show_title', True)
-                    self.background_style = data.get('background_style', copy.deepcopy(self.DEFAULT_BG_STYLE))
-                    self.show_background = data.get('show_background', True)
-                    self.option_style = data.get('option_style', copy.deepcopy(self.DEFAULT_OPTION_STYLE))
-                    self.bar_bg_style = data.get('bar_bg_style', copy.deepcopy(self.DEFAULT_BAR_BG_STYLE))
-                    self.bar_fill_style = data.get('bar_fill_style', copy.deepcopy(self.DEFAULT_BAR_FILL_STYLE))
-                    self.bar_text_style = data.get('bar_text_style', copy.deepcopy(self.DEFAULT_BAR_TEXT_STYLE))
-        except Exception as e:
-            logger.error(f"[Voting Config] Error loading config: {e}")
+        super().__init__()
 
-    def save_config(self):
-        try:
-            data = {
-                'title': self.title,
-                'title_style': self.title_style,
-                'show_title': self.show_title,
-                'background_style': self.background_style,
-                'show_background': self.show_background,
-                'option_style': self.option_style,
-                'bar_bg_style': self.bar_bg_style,
-                'bar_fill_style': self.bar_fill_style,
-                'bar_text_style': self.bar_text_style
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[Voting Config] Error saving config: {e}")
-            
     def start_voting(self, title: str, options: List[str], show_title: bool = None, show_background: bool = None):
         with self.lock:
             self.title = title
@@ -528,7 +668,7 @@ class VotingConfigState:
                 self.show_title = show_title
             if show_background is not None:
                 self.show_background = show_background
-            self.save_config()
+            self._mark_dirty()
             return self.get_state()
 
     def stop_voting(self):
@@ -542,31 +682,17 @@ class VotingConfigState:
             self.options = []
             self.vote_counts = []
             self.is_active = False
-            self.save_config()
+            self._mark_dirty()
             return self.get_state()
 
     def update_styles(self, data: dict):
         with self.lock:
-            if 'title' in data:
-                self.title = data['title']
-            if 'title_style' in data:
-                self.title_style = data['title_style']
-            if 'show_title' in data:
-                self.show_title = bool(data['show_title'])
-            if 'background_style' in data:
-                self.background_style = data['background_style']
-            if 'show_background' in data:
-                self.show_background = bool(data['show_background'])
-            if 'option_style' in data:
-                self.option_style = data['option_style']
-            if 'bar_bg_style' in data:
-                self.bar_bg_style = data['bar_bg_style']
-            if 'bar_fill_style' in data:
-                self.bar_fill_style = data['bar_fill_style']
-            if 'bar_text_style' in data:
-                self.bar_text_style = data['bar_text_style']
-            
-            self.save_config()
+            for name, coerce in _VOTING_STYLE_FIELDS:
+                if name in data:
+                    value = data[name]
+                    setattr(self, name, coerce(value) if coerce else value)
+
+            self._mark_dirty()
             return self.get_state()
             
     def register_vote(self, index: int):
@@ -580,55 +706,33 @@ class VotingConfigState:
 
     def get_state(self):
         with self.lock:
-            return {
-                'title': self.title,
-                'title_style': self.title_style,
-                'show_title': self.show_title,
-                'background_style': self.background_style,
-                'show_background': self.show_background,
-                'option_style': self.option_style,
-                'bar_bg_style': self.bar_bg_style,
-                'bar_fill_style': self.bar_fill_style,
-                'bar_text_style': self.bar_text_style,
-                'options': [{'idx': i, 'text': opt} for i, opt in enumerate(self.options)],
-                'vote_counts': list(self.vote_counts),
-                'is_active': self.is_active
-            }
+            voting_state = _thaw(self._config_payload())
+            voting_state['options'] = [{'idx': i, 'text': opt} for i, opt in enumerate(self.options)]
+            voting_state['vote_counts'] = list(self.vote_counts)
+            voting_state['is_active'] = self.is_active
+            return voting_state
 
 
 # -------------------------
 # Sound Configuration
 # -------------------------
-class SoundConfigState:
-    def __init__(self):
-        self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'sound_config.json'
-        self.commands = {}
-        self.load_config()
+class SoundConfigState(JsonBackedConfig):
+    FILENAME = 'sound_config.json'
+    LOG_TAG = 'Sound Config'
+    DEFAULTS = {
+        'commands': {}
+    }
 
-    def load_config(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    raw_commands = data.get('commands', {})
-                    for trigger, value in raw_commands.items():
-                        if isinstance(value, str):
-                            self.commands[trigger] = {'filename': value, 'volume': 1.0}
-                        elif isinstance(value, dict):
-                            self.commands[trigger] = {
-                                'filename': value.get('filename', ''),
-                                'volume': value.get('volume', 1.0)
-                            }
-        except Exception as e:
-            logger.error(f"[Sound Config] Error loading config: {e}")
-
-    def save_config(self):
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump({'commands': self.commands}, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[Sound Config] Error saving config: {e}")
+    def _apply_config(self, data: dict):
+        raw_commands = data.get('commands', {})
+        for trigger, value in raw_commands.items():
+            if isinstance(value, str):
+                self.commands[trigger] = {'filename': value, 'volume': 1.0}
+            elif isinstance(value, dict):
+                self.commands[trigger] = {
+                    'filename': value.get('filename', ''),
+                    'volume': value.get('volume', 1.0)
+                }
 
     def get_commands(self) -> Dict[str, dict]:
         with self.lock:
@@ -644,109 +748,80 @@ class SoundConfigState:
                 self.commands[trigger] = {'filename': filename, 'volume': 1.0}
             else:
                 self.commands[trigger]['filename'] = filename
-            self.save_config()
+            self._mark_dirty()
 
     def delete_command(self, trigger: str):
         with self.lock:
             if trigger in self.commands:
                 del self.commands[trigger]
-                self.save_config()
+                self._mark_dirty()
 
     def update_volume(self, trigger: str, volume: float):
         with self.lock:
             if trigger in self.commands:
                 self.commands[trigger]['volume'] = volume
-                self.save_config()
+                self._mark_dirty()
 
 
 # -------------------------
 # Member Progress Configuration
 # -------------------------
-class MemberProgressConfigState:
+class MemberProgressConfigState(JsonBackedConfig):
+    FILENAME = 'member_progress.json'
+    LOG_TAG = 'Member Progress'
     DEFAULT_TITLE = "冲舰"
-    DEFAULT_STYLE = { "type": "solid", "colors": ["#E8D57C"], "angle": 90, "glass_blur": 0, "glass_opacity": 1.0, "shadow_color": "#000000", "shadow_size": 0, "border_color": "#ffffff", "border_width": 0 }
-    DEFAULT_BG_STYLE = { "type": "solid", "colors": ["#5A4F77"], "angle": 135, "glass_blur": 0, "glass_opacity": 1.0, "shadow_color": "#000000", "shadow_size": 0, "border_color": "rgba(255, 215, 0, 0)", "border_width": 0 }
-    DEFAULT_LEVELS = [
+    DEFAULT_STYLE = _freeze({ "type": "solid", "colors": ["#E8D57C"], "angle": 90, "glass_blur": 0, "glass_opacity": 1.0, "shadow_color": "#000000", "shadow_size": 0, "border_color": "#ffffff", "border_width": 0 })
+    DEFAULT_BG_STYLE = _freeze({ "type": "solid", "colors": ["#5A4F77"], "angle": 135, "glass_blur": 0, "glass_opacity": 1.0, "shadow_color": "#000000", "shadow_size": 0, "border_color": "rgba(255, 215, 0, 0)", "border_width": 0 })
+    DEFAULT_LEVELS = _freeze([
         {"min": 0, "max": 50, "image": "souris_captain.png", "is_custom": False, "start_color": "#3498db", "end_color": "#5dade2"},
         {"min": 50, "max": 100, "image": "souris_admiral.png", "is_custom": False, "start_color": "#9b59b6", "end_color": "#bb8fce"},
         {"min": 100, "max": 999999, "image": "souris_governor.png", "is_custom": False, "start_color": "#f1c40f", "end_color": "#f7dc6f"}
-    ]
-
-    def __init__(self):
-        self.lock = threading.RLock()
-        self.config_file = Path(config.DATA_PATH) / 'member_progress.json'
-        self.title_text = self.DEFAULT_TITLE
-        self.title_style = self.DEFAULT_STYLE.copy()
-        self.show_title = True
-        self.background_style = self.DEFAULT_BG_STYLE.copy()
-        self.show_background = True
-        self.count_color = '#ffffff'
-        self.label_color = 'rgba(255, 255, 255, 0.8)'
-        self.image_size = 80
-        self.levels = self.DEFAULT_LEVELS.copy()
-        self.load_config()
-
-    def load_config(self):
-        try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.title_text = data.get('title_text', self.DEFAULT_TITLE)
-                    self.show_title = data.get('show_title', True)
-                    self.show_background = data.get('show_background', True)
-                    self.title_style = data.get('title_style', copy.deepcopy(self.DEFAULT_STYLE))
-                    self.background_style = data.get('background_style', copy.deepcopy(self.DEFAULT_BG_STYLE))
-                    self.levels = data.get('levels', copy.deepcopy(self.DEFAULT_LEVELS))
-                    self.count_color = data.get('count_color', '#ffffff')
-                    self.label_color = data.get('label_color', 'rgba(255, 255, 255, 0.8)')
-                    self.image_size = data.get('image_size', 80)
-        except Exception as e:
-            logger.error(f"[Member Progress] Error loading config: {e}")
+    ])
+    # levels shares the frozen defaults until set_level_image copies the edited level
+    DEFAULTS = {
+        'title_text': DEFAULT_TITLE,
+        'title_style': DEFAULT_STYLE,
+        'show_title': True,
+        'background_style': DEFAULT_BG_STYLE,
+        'show_background': True,
+        'count_color': '#ffffff',
+        'label_color': 'rgba(255, 255, 255, 0.8)',
+        'image_size': 80,
+        'levels': DEFAULT_LEVELS
+    }
 
-    def save_config(self):
-        try:
-            data = {
-                'title_text': self.title_text,
-                'title_style': self.title_style,
-                'show_title': self.show_title,
-                'background_style': self.background_style,
-                'show_background': self.show_background,
-                'count_color': self.count_color,
-                'label_color': self.label_color,
-                'image_size': self.image_size,
-                'levels': self.levels
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"[Member Progress] Error saving config: {e}")
-            
     def update(self, **kwargs):
         with self.lock:
             for k, v in kwargs.items():
                 if hasattr(self, k) and v is not None:
                     setattr(self, k, v)
-            self.save_config()
+            self._mark_dirty()
+
+    async def update_async(self, **kwargs):
+        """update() followed by an immediate save off the event loop"""
+        self.update(**kwargs)
+        await self.flush_async()
 
     def set_level_image(self, index, filename, is_custom=True):
         with self.lock:
             if 0 <= index < len(self.levels):
-                self.levels[index]['image'] = filename
-                self.levels[index]['is_custom'] = is_custom
-                self.save_config()
+                levels = list(self.levels)
+                levels[index] = {**levels[index], 'image': filename, 'is_custom': is_custom}
+                self.levels = levels
+                self._mark_dirty()
 
     def get_config(self) -> dict:
         with self.lock:
             return {
                 'title_text': self.title_text,
-                'title_style': self.title_style,
+                'title_style': _thaw(self.title_style),
                 'show_title': self.show_title,
-                'background_style': self.background_style,
+                'background_style': _thaw(self.background_style),
                 'show_background': self.show_background,
                 'count_color': self.count_color,
                 'label_color': self.label_color,
                 'image_size': self.image_size,
-                'levels': copy.deepcopy(self.levels)
+                'levels': [{**lvl} for lvl in self.levels]
             }
 
 
@@ -754,19 +829,38 @@ class MemberProgressConfigState:
 # -------------------------
 # File Persistence Tracker
 # -------------------------
+# Date segment of a log file name, e.g. room_1769174835-20260118_050632.txt
+_LOG_DATE_RE = re.compile(r'-(\d{8})_')
+
 class ProcessedFilesTracker:
-    """Tracks which log files have been processed to avoid reprocessing"""
+    """Tracks which log files have been processed to avoid reprocessing.
+
+    The tracking file keeps the full history, but only entries the watcher can
+    still ask about (today's logs, or names without a date) are held in memory.
+    """
     def __init__(self):
         self.TRACKING_FILE = Path(config.LOG_PATH) / 'accessed_file.txt'
         self._processed: set = set()
         self._lock = threading.RLock()
+        self._fh = None
         self._load()
+        atexit.register(self.close)
 
     def _load(self):
         try:
             if self.TRACKING_FILE.exists():
+                today = datetime.now().strftime('%Y%m%d')
+                processed = set()
                 with open(self.TRACKING_FILE, 'r') as f:
-                    self._processed = set(line.strip() for line in f if line.strip())
+                    for line in f:
+                        name = line.strip()
+                        if not name:
+                            continue
+                        m = _LOG_DATE_RE.search(name)
+                        if m and m.group(1) < today:
+                            continue
+                        processed.add(name)
+                self._processed = processed
         except Exception:
             self._processed = set()
 
@@ -778,8 +872,23 @@ class ProcessedFilesTracker:
         with self._lock:
             if filename not in self._processed:
                 self._processed.add(filename)
-                with open(self.TRACKING_FILE, 'a') as f:
-                    f.write(f"{filename}\n")
+                if self._fh is None:
+                    self._fh = open(self.TRACKING_FILE, 'a')
+                self._fh.write(f"{filename}\n")
+                # Write through: a mark lost to a crash would replay the whole log file on restart
+                self._fh.flush()
+
+    def flush(self):
+        """Push any pending marks to disk"""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
 
 # -------------------------
 # Shared State for Widgets (ASYNC)
@@ -800,9 +909,11 @@ class WidgetState:
         self.guard_counts: Dict[str, int] = {}
         self.milestone_progress = 0.0
         self.milestone_count = 0
+        # Mirrors gift_config.milestone_goal; refreshed by recalculate_milestones on goal changes
+        self._milestone_goal = gift_config.get_milestone_goal()
         self.total_guard_count = 0
         self.initial_guard_count = 0
-        self.recent_messages: List[ParsedMessage] = []
+        self.recent_messages: deque = deque(maxlen=config.RECENT_MSG_CAP)
         
         self.lock = asyncio.Lock()
 
@@ -810,7 +921,7 @@ class WidgetState:
         self.tts_queue: asyncio.Queue = asyncio.Queue()
         self.tts_playing: Optional[ParsedMessage] = None
         self.tts_autoplay = False
-        self.tts_messages: Dict[str, ParsedMessage] = {}
+        self.tts_messages: 'OrderedDict[str, ParsedMessage]' = OrderedDict()
 
         # Member display state
         self.member_queue: asyncio.Queue = asyncio.Queue()
@@ -818,10 +929,15 @@ class WidgetState:
 
         self.file_tracker = ProcessedFilesTracker()
 
+        # Read-only view served by get_state; replaced (never mutated) by every counter update
+        self._state_snapshot: dict = {}
+        self._rebuild_snapshot()
+
     async def set_initial_guard_count(self, count: int):
         async with self.lock:
             self.initial_guard_count = count
             self.total_guard_count = count
+            self._rebuild_snapshot()
 
     async def add_message(self, message: ParsedMessage):
         """Async method to add message and update state"""
@@ -829,15 +945,14 @@ class WidgetState:
             self.recent_messages.append(message)
             if message.tts_enabled and message.unique_id:
                 self.tts_messages[message.unique_id] = message
+                if len(self.tts_messages) > config.TTS_MSG_CAP:
+                    self.tts_messages.popitem(last=False)
 
             if message.type == MessageType.PAID_GIFT:
                 self.paid_gift_total_value += message.content.get('value', 0)
                 self.paid_gift_count += message.content.get('quantity', 0)
-                self.milestone_progress += message.content.get('value', 0)
-                milestone_goal = gift_config.get_milestone_goal()
-                while self.milestone_progress >= milestone_goal:
-                    self.milestone_progress -= milestone_goal
-                    self.milestone_count += 1
+                self._advance_milestone(message.content.get('value', 0))
+                self._rebuild_snapshot()
 
             elif message.type == MessageType.GUARD:
                 guard_type = message.content.get('guard_type')
@@ -849,11 +964,8 @@ class WidgetState:
                 
                 membership_price = message.content.get('value', 0.0)
                 self.membership_total_value += membership_price
-                self.milestone_progress += membership_price
-                milestone_goal = gift_config.get_milestone_goal()
-                while self.milestone_progress >= milestone_goal:
-                    self.milestone_progress -= milestone_goal
-                    self.milestone_count += 1
+                self._advance_milestone(membership_price)
+                self._rebuild_snapshot()
 
                 # Enqueue member
                 await self.member_queue.put(message)
@@ -863,20 +975,28 @@ class WidgetState:
 
             elif message.type == MessageType.SUPERCHAT:
                 self.superchat_total_value += message.content.get('amount', 0)
-                self.milestone_progress += message.content.get('amount', 0)
-                milestone_goal = gift_config.get_milestone_goal()
-                while self.milestone_progress >= milestone_goal:
-                    self.milestone_progress -= milestone_goal
-                    self.milestone_count += 1
+                self._advance_milestone(message.content.get('amount', 0))
+                self._rebuild_snapshot()
     
                 if self.tts_autoplay and not message.is_read:
                     await self.tts_queue.put((message, True))
 
+    def _advance_milestone(self, delta):
+        """Add delta to milestone progress and roll completed goals into milestone_count (caller holds lock)"""
+        self.milestone_progress += delta
+        goal = self._milestone_goal
+        if goal <= 0:
+            return
+        completed, self.milestone_progress = divmod(self.milestone_progress, goal)
+        if completed:
+            self.milestone_count += int(completed)
+
     async def recalculate_milestones(self, new_goal: int):
         """Recalculate milestone progress and count based on a new goal"""
         async with self.lock:
             if new_goal <= 0:
                 return
+            self._milestone_goal = new_goal
 
             total_revenue = (
                 self.paid_gift_total_value + 
@@ -886,6 +1006,7 @@ class WidgetState:
             
             self.milestone_count = int(total_revenue // new_goal)
             self.milestone_progress = total_revenue % new_goal
+            self._rebuild_snapshot()
             
             logger.info(f"[State] Recalculated milestones. Total Revenue: {total_revenue}, New Goal: {new_goal}, Count: {self.milestone_count}, Progress: {self.milestone_progress}")
     
@@ -898,16 +1019,20 @@ class WidgetState:
     async def get_member_queue_size(self) -> int:
         return self.member_queue.qsize()
     
+    def _rebuild_snapshot(self):
+        """Publish a fresh counter snapshot (caller holds lock)"""
+        self._state_snapshot = {
+            'paid_gift_total_value': self.paid_gift_total_value,
+            'paid_gift_count': self.paid_gift_count,
+            'guard_counts': self.guard_counts.copy(),
+            'milestone_progress': self.milestone_progress,
+            'milestone_count': self.milestone_count,
+            'total_guard_count': self.total_guard_count
+        }
+
     async def get_state(self):
-        async with self.lock:
-            return {
-                'paid_gift_total_value': self.paid_gift_total_value,
-                'paid_gift_count': self.paid_gift_count,
-                'guard_counts': self.guard_counts.copy(),
-                'milestone_progress': self.milestone_progress,
-                'milestone_count': self.milestone_count,
-                'total_guard_count': self.total_guard_count
-            }
+        """Latest counter snapshot; shared, so callers must not mutate it"""
+        return self._state_snapshot
             
     async def toggle_message_read_status(self, unique_id: str) -> bool:
         async with self.lock:
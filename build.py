@@ -3,8 +3,18 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst (PyInstaller only reads staged files); copy when linking isn't possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device staging (EXDEV) or a filesystem without hardlink support
+        shutil.copy2(src, dst)
+    return dst
+
 def create_dist_package():
     """
     Creates a clean staging area, bundles the application, and optionally runs PyInstaller.
@@ -33,15 +43,21 @@ def create_dist_package():
     # 2. Copy Core Directories
     # 'app' is the new Python package core
     core_folders = ['app', 'static', 'templates', 'blcsdk', 'audio_commands', 'tts_engines']
-    for folder in core_folders:
-        src = PROJECT_ROOT / folder
-        dest = STAGING_DIR / folder
-        if src.exists():
-            # Filter out pycache and other garbage
-            shutil.copytree(src, dest, ignore=shutil.ignore_patterns('__pycache__', '*.pyc', '.DS_Store'))
-            print(f"  ✅ Copied folder: {folder}")
-        else:
-            print(f"  ⚠️  Missing optional folder: {folder}")
+    # Filter out pycache and other garbage
+    ignore = shutil.ignore_patterns('__pycache__', '*.pyc', '.DS_Store')
+    # Folders are independent and copying is syscall-bound, so copy them concurrently
+    with ThreadPoolExecutor(max_workers=len(core_folders)) as executor:
+        futures = {}
+        for folder in core_folders:
+            src = PROJECT_ROOT / folder
+            if src.exists():
+                futures[executor.submit(shutil.copytree, src, STAGING_DIR / folder,
+                                        ignore=ignore, copy_function=_link_or_copy)] = folder
+            else:
+                print(f"  ⚠️  Missing optional folder: {folder}")
+        for future in as_completed(futures):
+            future.result()
+            print(f"  ✅ Copied folder: {futures[future]}")
 
     # 3. Copy Root Files
     core_files = [
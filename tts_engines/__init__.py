@@ -6,9 +6,32 @@ Provides abstraction layer for multiple TTS engines (Kokoro, AWS Polly).
 Uses singleton pattern to ensure only one engine instance is active at a time.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from functools import lru_cache
+import importlib.util
+from typing import Dict, Iterator, Sequence
 import io
 
+# sounddevice loads PortAudio, so it is imported on first playback stop rather than at import time
+_sd = None
+
+
+def _sounddevice():
+    """Return the sounddevice module, importing it on first use."""
+    global _sd
+    if _sd is None:
+        import sounddevice
+        _sd = sounddevice
+    return _sd
+
+
+@lru_cache(maxsize=None)
+def _has_module(name: str) -> bool:
+    """Whether find_spec locates the module (it walks sys.path, so each name is probed once)."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except Exception:
+        return False
+
 
 class TTSEngine(ABC):
     """Base class for TTS engines. Each engine is a singleton - only one instance exists."""
@@ -27,12 +50,20 @@ class TTSEngine(ABC):
         """
         pass
 
+    def generate_audio_stream(self, text: str, voice: str, speed: float) -> Iterator[bytes]:
+        """Yield WAV audio as it becomes available (header first, then PCM data).
+
+        The default implementation yields the fully buffered result of generate_audio;
+        engines that synthesize incrementally override this to emit early.
+        """
+        yield self.generate_audio(text, voice, speed).getvalue()
+
     @abstractmethod
-    def get_available_voices(self) -> List[Dict[str, str]]:
-        """Return list of available voices.
+    def get_available_voices(self) -> Sequence[Dict[str, str]]:
+        """Return available voices (a shared, read-only sequence).
 
         Returns:
-            List of {'value': 'voice_id', 'label': 'Display Name'}
+            Sequence of {'value': 'voice_id', 'label': 'Display Name'}
         """
         pass
 
@@ -65,6 +96,18 @@ class TTSEngine(ABC):
         """Check if engine is ready (credentials valid, model loaded, etc.)."""
         pass
 
+    def warmup(self) -> None:
+        """Load models/clients ahead of the first request. Safe to run in a background thread."""
+        pass
+
+    def stop_playback(self) -> None:
+        """Stop any of this engine's audio that is still playing.
+
+        Generated audio is played by the caller through sounddevice, so the default
+        stops sounddevice playback; engines with their own output override this.
+        """
+        _sounddevice().stop()
+
 
 # Export classes for easier imports
 from .kokoro_engine import KokoroEngine
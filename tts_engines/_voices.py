@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+TTS Voice Lists
+
+Voice constants shared by the engines and the manager, kept separate so listing
+voices never imports an engine module (and its numpy/boto3 dependencies).
+Tuples are shared as-is; treat them as read-only.
+"""
+
+# Available Chinese voices (Kokoro)
+KOKORO_VOICES = (
+    {'value': 'zm_yunjian', 'label': 'Chinese Male (云健)'},
+    {'value': 'zf_xiaoxiao', 'label': 'Chinese Female (晓晓)'},
+    {'value': 'zf_xiaoyi', 'label': 'Chinese Female (晓依)'},
+    {'value': 'zm_yunxi', 'label': 'Chinese Male (云希)'},
+)
+
+# Available Chinese voices (AWS Polly)
+POLLY_VOICES = (
+    {'value': 'Zhiyu-Neural', 'label': 'Zhiyu (Female - Neural)'},
+    {'value': 'Zhiyu-Standard', 'label': 'Zhiyu (Female - Standard)'},
+)
+
+VOICES_BY_ENGINE = {
+    'kokoro': KOKORO_VOICES,
+    'aws_polly': POLLY_VOICES,
+}
@@ -7,12 +7,30 @@ Maintains a single pipeline instance that is reused for all TTS calls.
 """
 import gc
 import io
-from typing import List, Dict
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import List, Dict, Iterator, Optional, Sequence
 
 import numpy as np
 import soundfile as sf
 
 from . import TTSEngine
+from ._voices import KOKORO_VOICES
+
+logger = logging.getLogger('biliutility.tts_engines')
+
+SAMPLE_RATE = 24000
+
+# 16-bit mono PCM WAV header with unknown (max) sizes, for streamed output
+_STREAM_WAV_HEADER = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0xFFFFFFFF, b'WAVE', b'fmt ', 16, 1, 1,
+    SAMPLE_RATE, SAMPLE_RATE * 2, 2, 16, b'data', 0xFFFFFFFF,
+)
 
 
 class KokoroEngine(TTSEngine):
@@ -23,29 +41,104 @@ class KokoroEngine(TTSEngine):
     pipeline recreation.
     """
 
+    # Run inference under FP16 autocast on CUDA (opt-in, set KOKORO_FP16=1)
+    USE_FP16 = os.getenv('KOKORO_FP16', '').lower() in ('1', 'true', 'yes')
+
+    # Result of the one-time kokoro import check, shared by all instances
+    _available: Optional[bool] = None
+
+    # Convert float audio to 16-bit PCM with numpy before encoding instead of writing float WAV
+    # through libsndfile (on by default, set KOKORO_NUMPY_PCM16=0 to disable)
+    NUMPY_PCM16 = os.getenv('KOKORO_NUMPY_PCM16', '1').lower() in ('1', 'true', 'yes')
+
+    # Rendered-WAV LRU cache limits (entries, total bytes)
+    AUDIO_CACHE_SIZE = 256
+    AUDIO_CACHE_BYTES = 64 * 1024 * 1024
+
     # Available Chinese voices
-    VOICES = [
-        {'value': 'zm_yunjian', 'label': 'Chinese Male (云健)'},
-        {'value': 'zf_xiaoxiao', 'label': 'Chinese Female (晓晓)'},
-        {'value': 'zf_xiaoyi', 'label': 'Chinese Female (晓依)'},
-        {'value': 'zm_yunxi', 'label': 'Chinese Male (云希)'},
-    ]
+    VOICES = KOKORO_VOICES
 
     def __init__(self):
         """Initialize Kokoro engine with lazy pipeline creation."""
         self._pipeline = None  # Lazy initialization
+        self._pipeline_lock = threading.Lock()  # serializes the (slow) pipeline load
+        self._state_lock = threading.Lock()  # guards publishing the pipeline vs. dispose
+        self._disposed = False
+        self._autocast = None
+        self._audio_cache: OrderedDict = OrderedDict()  # (text, voice, speed) -> WAV bytes
+        self._audio_cache_bytes = 0
+        self._cache_lock = threading.Lock()
         self._voice = 'zm_yunjian'
         self._speed_normal = 0.7
         self._speed_name = 0.6
-        print("[KokoroEngine] Initialized (pipeline will be created on first use)")
+        logger.info("[KokoroEngine] Initialized (pipeline will be created on first use)")
 
     def _ensure_pipeline(self):
-        """Create pipeline only once, reuse for all calls."""
-        if self._pipeline is None:
-            print("[KokoroEngine] Creating Kokoro pipeline (first use)...")
+        """Create pipeline only once, reuse for all calls. Returns the pipeline."""
+        pipeline = self._pipeline
+        if pipeline is not None:
+            return pipeline
+        with self._pipeline_lock:
+            pipeline = self._pipeline
+            if pipeline is not None:
+                return pipeline
+            if self._disposed:
+                raise RuntimeError("Kokoro engine has been disposed")
+            logger.info("[KokoroEngine] Creating Kokoro pipeline (first use)...")
             from kokoro import KPipeline
-            self._pipeline = KPipeline(lang_code='z', repo_id='hexgrad/Kokoro-82M')
-            print("[KokoroEngine] Pipeline created successfully")
+            pipeline = KPipeline(lang_code='z', repo_id='hexgrad/Kokoro-82M')
+            autocast = self._make_autocast()
+            with self._state_lock:
+                # dispose() may have run while the model was loading (e.g. a switch during warm-up);
+                # publishing then would pin the model on an engine nobody uses again
+                if not self._disposed:
+                    self._autocast = autocast
+                    self._pipeline = pipeline
+            if self._pipeline is not pipeline:
+                del pipeline
+                gc.collect()
+                raise RuntimeError("Kokoro engine was disposed while loading the pipeline")
+            logger.info("[KokoroEngine] Pipeline created successfully")
+            return pipeline
+
+    def _make_autocast(self):
+        """Return a factory for the inference precision context (FP16 autocast or no-op)."""
+        if not self.USE_FP16:
+            return nullcontext
+        try:
+            import torch
+            if torch.cuda.is_available():
+                logger.info("[KokoroEngine] Using FP16 autocast on CUDA")
+                return lambda: torch.autocast('cuda', dtype=torch.float16)
+        except Exception as e:
+            logger.warning(f"[KokoroEngine] FP16 unavailable, using default precision: {e}")
+        return nullcontext
+
+    def _synthesize(self, text: str, voice: str, speed: float) -> Iterator[np.ndarray]:
+        """Run the pipeline and yield each audio chunk as a numpy array."""
+        pipeline = self._ensure_pipeline()
+        results = iter(pipeline(text, voice=voice, speed=speed))
+        while True:
+            # The precision context is thread-local and a streaming consumer may resume this
+            # generator on another thread, so it is entered per chunk, never across a yield
+            with self._autocast():
+                try:
+                    _, _, audio = next(results)
+                except StopIteration:
+                    return
+                if audio is not None and hasattr(audio, 'cpu'):
+                    audio = audio.float().cpu().numpy()
+            if audio is not None:
+                yield audio
+
+    def warmup(self) -> None:
+        """Create the pipeline and run a short synthesis so the first real request is fast."""
+        try:
+            for _ in self._synthesize('你好', self._voice, 1.0):
+                pass
+            logger.info("[KokoroEngine] Warm-up complete")
+        except Exception as e:
+            logger.warning(f"[KokoroEngine] Warm-up failed: {e}")
 
     def generate_audio(self, text: str, voice: str, speed: float) -> io.BytesIO:
         """Generate audio using EXISTING pipeline (no new pipeline creation).
@@ -61,33 +154,86 @@ class KokoroEngine(TTSEngine):
         if not text.strip():
             raise ValueError("Text cannot be empty")
 
-        self._ensure_pipeline()
+        key = (text, voice, round(speed, 2))
+        with self._cache_lock:
+            cached = self._audio_cache.get(key)
+            if cached is not None:
+                self._audio_cache.move_to_end(key)
+                return io.BytesIO(cached)
 
         # Generate audio using existing pipeline
-        audio_chunks = []
-        for _, _, audio in self._pipeline(text, voice=voice, speed=speed):
-            if audio is not None:
-                if hasattr(audio, 'cpu'):
-                    audio_chunks.append(audio.cpu().numpy())
-                else:
-                    audio_chunks.append(audio)
+        audio_chunks = list(self._synthesize(text, voice, speed))
 
         if not audio_chunks:
             raise RuntimeError(f"No audio generated for text: {text[:50]}")
 
-        # Concatenate all audio chunks
-        full_audio = np.concatenate(audio_chunks)
+        full_audio = self._join_chunks(audio_chunks)
 
         # Write audio to BytesIO buffer as WAV format (24kHz sample rate)
         audio_buffer = io.BytesIO()
-        sf.write(audio_buffer, full_audio, 24000, format='WAV')
+        if self.NUMPY_PCM16:
+            sf.write(audio_buffer, self._to_pcm16(full_audio), SAMPLE_RATE, format='WAV', subtype='PCM_16')
+        else:
+            sf.write(audio_buffer, full_audio, SAMPLE_RATE, format='WAV')
         audio_buffer.seek(0)
 
+        self._cache_audio(key, audio_buffer.getvalue())
         return audio_buffer
 
-    def get_available_voices(self) -> List[Dict[str, str]]:
+    def generate_audio_stream(self, text: str, voice: str, speed: float) -> Iterator[bytes]:
+        """Yield a streaming WAV header, then 16-bit PCM for each chunk as the pipeline produces it."""
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        yield _STREAM_WAV_HEADER
+        for chunk in self._synthesize(text, voice, speed):
+            yield self._to_pcm16(chunk).tobytes()
+
+    @staticmethod
+    def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+        """Scale float samples in [-1, 1] to little-endian int16 (audio itself is left untouched)."""
+        # The multiply allocates the scratch buffer; pipeline arrays may be read-only or shared
+        scaled = np.multiply(audio, 32767.0)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype('<i2')
+
+    @staticmethod
+    def _join_chunks(chunks: List[np.ndarray]) -> np.ndarray:
+        """Copy chunks into one preallocated array (a single chunk is used as-is)."""
+        if len(chunks) == 1:
+            return chunks[0]
+        full_audio = np.empty(sum(c.shape[0] for c in chunks), dtype=chunks[0].dtype)
+        offset = 0
+        for chunk in chunks:
+            end = offset + chunk.shape[0]
+            full_audio[offset:end] = chunk
+            offset = end
+        return full_audio
+
+    def _cache_audio(self, key, data: bytes) -> None:
+        """Store rendered audio, evicting least-recently-used entries over the limits."""
+        if len(data) > self.AUDIO_CACHE_BYTES:
+            return
+        with self._cache_lock:
+            old = self._audio_cache.pop(key, None)
+            if old is not None:
+                self._audio_cache_bytes -= len(old)
+            self._audio_cache[key] = data
+            self._audio_cache_bytes += len(data)
+            while (len(self._audio_cache) > self.AUDIO_CACHE_SIZE
+                   or self._audio_cache_bytes > self.AUDIO_CACHE_BYTES):
+                _, evicted = self._audio_cache.popitem(last=False)
+                self._audio_cache_bytes -= len(evicted)
+
+    def clear_audio_cache(self) -> None:
+        with self._cache_lock:
+            self._audio_cache.clear()
+            self._audio_cache_bytes = 0
+
+    def get_available_voices(self) -> Sequence[Dict[str, str]]:
         """Return list of available Kokoro voices."""
-        return self.VOICES.copy()
+        return self.VOICES
 
     def update_config(self, voice: str, speed_normal: float, speed_name: float) -> None:
         """Update voice/speed config - NO pipeline recreation needed.
@@ -98,18 +244,21 @@ class KokoroEngine(TTSEngine):
         self._voice = voice
         self._speed_normal = speed_normal
         self._speed_name = speed_name
-        print(f"[KokoroEngine] Config updated - Voice: {voice}, Speed: {speed_normal}/{speed_name}")
+        logger.debug(f"[KokoroEngine] Config updated - Voice: {voice}, Speed: {speed_normal}/{speed_name}")
 
     def dispose(self) -> None:
         """Clean up pipeline and free memory (VRAM/RAM)."""
-        if self._pipeline is not None:
-            print("[KokoroEngine] Disposing pipeline...")
-            del self._pipeline
-            self._pipeline = None
+        self.clear_audio_cache()
+        with self._state_lock:
+            self._disposed = True
+            pipeline, self._pipeline = self._pipeline, None
+        if pipeline is not None:
+            logger.info("[KokoroEngine] Disposing pipeline...")
+            del pipeline
             gc.collect()  # Force garbage collection to free VRAM
-            print("[KokoroEngine] Pipeline disposed, memory freed")
+            logger.info("[KokoroEngine] Pipeline disposed, memory freed")
         else:
-            print("[KokoroEngine] No pipeline to dispose")
+            logger.debug("[KokoroEngine] No pipeline to dispose")
 
     def get_engine_name(self) -> str:
         """Return engine display name."""
@@ -117,11 +266,14 @@ class KokoroEngine(TTSEngine):
 
     def is_available(self) -> bool:
         """Check if Kokoro is available (always true if package is installed)."""
-        try:
-            from kokoro import KPipeline
-            return True
-        except ImportError:
-            return False
+        cls = type(self)
+        if cls._available is None:
+            try:
+                from kokoro import KPipeline
+                cls._available = True
+            except ImportError:
+                cls._available = False
+        return cls._available
 
     @property
     def voice(self) -> str:
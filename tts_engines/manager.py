@@ -5,9 +5,30 @@ TTS Engine Manager
 Singleton manager that ensures only ONE TTS engine is active at a time.
 Handles engine lifecycle, switching, and proper disposal.
 """
-from typing import Optional
+import asyncio
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Optional, Sequence
 
-from . import TTSEngine
+from . import TTSEngine, _has_module, _sounddevice
+from ._voices import VOICES_BY_ENGINE
+
+logger = logging.getLogger('biliutility.tts_engines')
+
+# Guards creation of the TTSEngineManager singleton
+_singleton_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _check_kokoro() -> bool:
+    return _has_module("kokoro")
+
+
+@lru_cache(maxsize=None)
+def _check_polly(access_present: bool, secret_present: bool) -> bool:
+    # Keyed on credential presence so env changes are seen without re-probing boto3
+    return access_present and secret_present and _has_module("boto3")
 
 
 class TTSEngineManager:
@@ -25,33 +46,60 @@ class TTSEngineManager:
     _instance: Optional['TTSEngineManager'] = None
 
     def __new__(cls) -> 'TTSEngineManager':
-        """Ensure only one instance exists (singleton pattern)."""
+        """Ensure only one instance exists (singleton pattern, double-checked locking)."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._current_engine: Optional[TTSEngine] = None
-            cls._instance._current_engine_type: Optional[str] = None
-            cls._instance._sio = None
-            cls._instance._availability_cache = {}
-            cls._instance._voices_cache = {}
-            print("[TTSEngineManager] Singleton instance created")
+            with _singleton_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize()
+                    # Publish only after every attribute is set
+                    cls._instance = instance
+                    logger.info("[TTSEngineManager] Singleton instance created")
         return cls._instance
 
-    def set_sio(self, sio):
-        """Set SocketIO instance for broadcasting updates."""
+    def _initialize(self) -> None:
+        """Set up instance state exactly once, before the singleton is published."""
+        self._current_engine: Optional[TTSEngine] = None
+        self._current_engine_type: Optional[str] = None
+        self._sio = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Serializes engine creation/disposal between threads
+        self._engine_lock = threading.RLock()
+
+    def set_sio(self, sio, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Set SocketIO instance for broadcasting updates.
+
+        The event loop the server runs on is captured here (or passed explicitly) so
+        switch_engine can emit from any thread.
+        """
         self._sio = sio
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self._loop = loop
 
     def get_engine(self) -> TTSEngine:
         """Get the current active engine (creates default Kokoro if none).
 
+        The common case is a single attribute read; the engine lock is only taken
+        when no engine is active yet (double-checked).
+
         Returns:
             The currently active TTS engine
         """
-        if self._current_engine is None:
-            # We import here to avoid circular imports and only load when needed
-            from app.state import tts_config
-            print(f"[TTSEngineManager] No engine active, creating default ({tts_config.engine})...")
-            self.switch_engine(tts_config.engine)
-        return self._current_engine
+        engine = self._current_engine
+        if engine is not None:
+            return engine
+        with self._engine_lock:
+            engine = self._current_engine
+            if engine is None:
+                # We import here to avoid circular imports and only load when needed
+                from app.state import tts_config
+                logger.info(f"[TTSEngineManager] No engine active, creating default ({tts_config.engine})...")
+                engine = self.switch_engine(tts_config.engine)
+            return engine
 
     def get_current_engine_type(self) -> Optional[str]:
         """Get the current engine type name.
@@ -73,59 +121,66 @@ class TTSEngineManager:
         Returns:
             The newly activated TTS engine
         """
-        # Check if already using this engine
-        if self._current_engine_type == engine_type and self._current_engine is not None:
-            print(f"[TTSEngineManager] Already using {engine_type} engine")
-            return self._current_engine
-
-        # Stop any ongoing playback before switching
-        self._stop_playback()
-
-        # Dispose old engine FIRST (before creating new one)
-        if self._current_engine is not None:
-            print(f"[TTSEngineManager] Disposing {self._current_engine_type} engine...")
-            self._current_engine.dispose()
-            self._current_engine = None
-            self._current_engine_type = None
-
-        # Create new engine
-        print(f"[TTSEngineManager] Creating {engine_type} engine...")
-        try:
-            if engine_type == 'kokoro':
-                from .kokoro_engine import KokoroEngine
-                self._current_engine = KokoroEngine()
-            elif engine_type == 'aws_polly':
-                from .polly_engine import PollyEngine
-                self._current_engine = PollyEngine()
-            else:
-                raise ValueError(f"Unknown engine type: {engine_type}")
-        except Exception as e:
-            print(f"[TTSEngineManager] Critical error creating engine {engine_type}: {e}")
-            # Fallback to Kokoro if AWS fails, but avoid infinite loop
-            if engine_type != 'kokoro':
-                print("[TTSEngineManager] Attempting fallback to kokoro...")
-                return self.switch_engine('kokoro')
-            raise
-
-        self._current_engine_type = engine_type
-        print(f"[TTSEngineManager] Now using {engine_type} engine")
-
-        # Broadcast config update to frontend if sio available
-        if self._sio:
-            import asyncio
+        with self._engine_lock:
+            # Unavailable engines (missing package/credentials) go straight to kokoro instead of
+            # being constructed only to fail
+            if engine_type != 'kokoro' and not self.is_engine_available(engine_type):
+                logger.warning(f"[TTSEngineManager] {engine_type} engine not available, using kokoro")
+                engine_type = 'kokoro'
+
+            # Check if already using this engine
+            if self._current_engine_type == engine_type and self._current_engine is not None:
+                logger.debug(f"[TTSEngineManager] Already using {engine_type} engine")
+                return self._current_engine
+
+            # Stop any ongoing playback before switching
+            self._stop_playback()
+
+            # Dispose old engine FIRST (before creating new one)
+            if self._current_engine is not None:
+                logger.info(f"[TTSEngineManager] Disposing {self._current_engine_type} engine...")
+                self._current_engine.dispose()
+                self._current_engine = None
+                self._current_engine_type = None
+
+            # Create new engine
+            logger.info(f"[TTSEngineManager] Creating {engine_type} engine...")
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self._sio.emit('tts:config_updated', {
-                        "engine": engine_type,
-                        "voice": self._current_engine.voice,
-                        "speed_normal": self._current_engine.speed_normal,
-                        "speed_name": self._current_engine.speed_name
-                    }))
+                if engine_type == 'kokoro':
+                    from .kokoro_engine import KokoroEngine
+                    engine = KokoroEngine()
+                elif engine_type == 'aws_polly':
+                    from .polly_engine import PollyEngine
+                    engine = PollyEngine()
+                else:
+                    raise ValueError(f"Unknown engine type: {engine_type}")
             except Exception as e:
-                print(f"[TTSEngineManager] Failed to emit engine switch: {e}")
+                logger.error(f"[TTSEngineManager] Critical error creating engine {engine_type}: {e}")
+                # Unexpected construction failure: fall back to Kokoro, but avoid infinite loop
+                if engine_type != 'kokoro':
+                    logger.info("[TTSEngineManager] Attempting fallback to kokoro...")
+                    return self.switch_engine('kokoro')
+                raise
+
+            # Publish the engine last: lock-free readers in get_engine see either None or a ready engine
+            self._current_engine_type = engine_type
+            self._current_engine = engine
+            logger.info(f"[TTSEngineManager] Now using {engine_type} engine")
+
+            # Broadcast config update to frontend if sio available
+            if self._sio and self._loop is not None:
+                payload = {
+                    "engine": engine_type,
+                    "voice": self._current_engine.voice,
+                    "speed_normal": self._current_engine.speed_normal,
+                    "speed_name": self._current_engine.speed_name
+                }
+                try:
+                    asyncio.run_coroutine_threadsafe(self._sio.emit('tts:config_updated', payload), self._loop)
+                except Exception as e:
+                    logger.error(f"[TTSEngineManager] Failed to emit engine switch: {e}")
 
-        return self._current_engine
+            return self._current_engine
 
     def update_config(self, voice: str, speed_normal: float, speed_name: float) -> None:
         """Update current engine config WITHOUT switching/recreating.
@@ -141,7 +196,7 @@ class TTSEngineManager:
         if self._current_engine is not None:
             self._current_engine.update_config(voice, speed_normal, speed_name)
         else:
-            print("[TTSEngineManager] No engine active, config update skipped")
+            logger.debug("[TTSEngineManager] No engine active, config update skipped")
 
     def is_engine_available(self, engine_type: str, use_cache: bool = True) -> bool:
         """Check if a specific engine type is available.
@@ -153,34 +208,16 @@ class TTSEngineManager:
         Returns:
             True if the engine can be used
         """
-        if use_cache and engine_type in self._availability_cache:
-            return self._availability_cache[engine_type]
+        if not use_cache:
+            _has_module.cache_clear()
+            _check_kokoro.cache_clear()
+            _check_polly.cache_clear()
 
-        is_available = False
         if engine_type == 'kokoro':
-            try:
-                # We check for the module presence without importing everything if possible
-                # However, kokoro usually doesn't have a submodule for just checking.
-                # Python's import system caches imports anyway.
-                import importlib.util
-                is_available = importlib.util.find_spec("kokoro") is not None
-            except Exception:
-                is_available = False
-        elif engine_type == 'aws_polly':
-            import os
-            access_key = os.getenv('AWS_ACCESS_KEY_ID')
-            secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
-            if access_key and secret_key:
-                try:
-                    import importlib.util
-                    is_available = importlib.util.find_spec("boto3") is not None
-                except:
-                    is_available = False
-            else:
-                is_available = False
-        
-        self._availability_cache[engine_type] = is_available
-        return is_available
+            return _check_kokoro()
+        if engine_type == 'aws_polly':
+            return _check_polly(bool(os.getenv('AWS_ACCESS_KEY_ID')), bool(os.getenv('AWS_SECRET_ACCESS_KEY')))
+        return False
 
     def get_available_engines(self) -> list:
         """Get list of available engine types.
@@ -197,54 +234,41 @@ class TTSEngineManager:
 
     def dispose_current(self) -> None:
         """Dispose the current engine (for shutdown/cleanup)."""
-        self._stop_playback()
-        if self._current_engine is not None:
-            print(f"[TTSEngineManager] Disposing current engine ({self._current_engine_type})...")
-            self._current_engine.dispose()
-            self._current_engine = None
-            self._current_engine_type = None
-            print("[TTSEngineManager] Engine disposed")
+        with self._engine_lock:
+            self._stop_playback()
+            if self._current_engine is not None:
+                logger.info(f"[TTSEngineManager] Disposing current engine ({self._current_engine_type})...")
+                self._current_engine.dispose()
+                self._current_engine = None
+                self._current_engine_type = None
+                logger.info("[TTSEngineManager] Engine disposed")
         
-        # Clear cache on disposal as environment might have changed (e.g. AWS keys)
-        self._availability_cache.clear()
+            # Clear cache on disposal as environment might have changed (e.g. AWS keys)
+            _check_kokoro.cache_clear()
+            _check_polly.cache_clear()
 
-    def get_voices_by_type(self, engine_type: str) -> list:
+    def get_voices_by_type(self, engine_type: str) -> Sequence[dict]:
         """Get available voices for a specific engine type.
 
         Args:
             engine_type: 'kokoro' or 'aws_polly'
 
         Returns:
-            List of voice dictionaries
+            Shared read-only sequence of voice dictionaries (empty if unknown)
         """
-        if engine_type in self._voices_cache:
-            return self._voices_cache[engine_type]
-
-        voices = []
-        if engine_type == 'kokoro':
-            try:
-                from .kokoro_engine import KokoroEngine
-                voices = KokoroEngine.VOICES
-            except:
-                pass
-        elif engine_type == 'aws_polly':
-            try:
-                from .polly_engine import PollyEngine
-                voices = PollyEngine.VOICES
-            except:
-                pass
-        
-        if voices:
-            self._voices_cache[engine_type] = voices
-        return voices
+        return VOICES_BY_ENGINE.get(engine_type, ())
 
     def _stop_playback(self) -> None:
         """Stop any ongoing audio playback."""
+        engine = self._current_engine
         try:
-            import sounddevice as sd
-            sd.stop()
+            if engine is not None:
+                engine.stop_playback()
+            else:
+                # Command sounds can still be playing without an active engine
+                _sounddevice().stop()
         except Exception as e:
-            print(f"[TTSEngineManager] Error stopping playback: {e}")
+            logger.error(f"[TTSEngineManager] Error stopping playback: {e}")
 
 
 # Global singleton instance
@@ -6,12 +6,136 @@ Uses AWS Polly for cloud-based text-to-speech.
 Maintains a single boto3 client instance that is reused for all API calls.
 """
 import io
+import logging
 import os
 import struct
-import wave
-from typing import List, Dict
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape as _xml_escape
 
-from . import TTSEngine
+from . import TTSEngine, _has_module
+from ._voices import POLLY_VOICES
+
+logger = logging.getLogger('biliutility.tts_engines')
+
+# boto3 takes hundreds of ms to import; it is loaded once, off the request path when possible
+_boto3 = None
+_boto3_lock = threading.Lock()
+
+
+def _import_boto3():
+    """Return the boto3 module, importing it on first use."""
+    global _boto3
+    if _boto3 is None:
+        with _boto3_lock:
+            if _boto3 is None:
+                import boto3
+                _boto3 = boto3
+    return _boto3
+
+
+# RIFF/WAVE header for 16-bit mono PCM: riff id, riff size, wave id, fmt id, fmt size,
+# format (PCM), channels, sample rate, byte rate, block align, bits per sample, data id, data size
+_WAV_HEADER_FMT = '<4sI4s4sIHHIIHH4sI'
+
+
+# Per-thread scratch buffer reused across synth calls; buffers grown past the cap are not kept
+_tls = threading.local()
+_SCRATCH_MIN = 1 << 17
+_SCRATCH_MAX = 4 << 20
+
+
+def _get_scratch() -> bytearray:
+    buf = getattr(_tls, 'buf', None)
+    if buf is None:
+        buf = _tls.buf = bytearray(_SCRATCH_MIN)
+    return buf
+
+
+def _stream_to_wav(stream, sample_rate: int) -> io.BytesIO:
+    """Copy a PCM response stream into a WAV buffer, patching the header at the end.
+
+    PCM is gathered in the thread's scratch buffer, so only the returned
+    BytesIO is allocated per call in steady state.
+    """
+    buf = _get_scratch()
+    pos = 44
+    chunks = stream.iter_chunks(chunk_size=64 * 1024) if hasattr(stream, 'iter_chunks') else (stream.read(),)
+    for chunk in chunks:
+        end = pos + len(chunk)
+        buf[pos:end] = chunk  # grows the bytearray in place when past its end
+        pos = end
+    pcm_len = pos - 44
+    struct.pack_into(_WAV_HEADER_FMT, buf, 0, b'RIFF', 36 + pcm_len, b'WAVE', b'fmt ', 16, 1, 1,
+                     sample_rate, sample_rate * 2, 2, 16, b'data', pcm_len)
+    # BytesIO copies the view, so the caller may keep the result after the scratch is reused
+    with memoryview(buf) as view:
+        wav = io.BytesIO(view[:pos])
+    if len(buf) > _SCRATCH_MAX:
+        _tls.buf = None
+    return wav
+
+
+def _speed_to_pct(speed: float) -> int:
+    # Kokoro uses 0.3-2.0, Polly uses 20%-200%
+    return max(20, min(200, int(speed * 100)))
+
+
+# Prosody rate for every UI slider step (0.3-2.0 in 0.05 steps), keyed by the rounded speed
+_SPEED_TO_PCT: Dict[float, int] = {
+    speed: _speed_to_pct(speed) for speed in (round(0.3 + step * 0.05, 2) for step in range(35))
+}
+
+
+def _prosody_rate(speed: float) -> int:
+    """SSML prosody rate percent for a speed multiplier (table hit for slider values)."""
+    rate_percent = _SPEED_TO_PCT.get(round(speed, 2))
+    if rate_percent is None:
+        rate_percent = _speed_to_pct(speed)
+    return rate_percent
+
+
+@lru_cache(maxsize=8)
+def _parse_voice(voice: str) -> Tuple[str, Optional[str]]:
+    """Split 'Zhiyu-Neural' into ('Zhiyu', 'neural'); plain voice ids give (voice, None)."""
+    if '-' in voice:
+        base_voice, engine_suffix = voice.split('-', 1)
+        return base_voice, engine_suffix.lower()
+    return voice, None
+
+
+# SSML prosody (prefix, suffix) per rate percent; only a handful of rates are ever used
+_SSML_CACHE: Dict[int, tuple] = {}
+
+
+# Polly clients are thread-safe and expensive to build (endpoint resolution, signer setup), so
+# they outlive engine instances. Keyed by region and credentials so key changes get a new client.
+_POLLY_CLIENTS: Dict[tuple, object] = {}
+_POLLY_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_polly_client(region: str):
+    """Return the shared Polly client for region and the current AWS credentials."""
+    key = (region, os.getenv('AWS_ACCESS_KEY_ID'), os.getenv('AWS_SECRET_ACCESS_KEY'))
+    client = _POLLY_CLIENTS.get(key)
+    if client is None:
+        with _POLLY_CLIENTS_LOCK:
+            client = _POLLY_CLIENTS.get(key)
+            if client is None:
+                client = _import_boto3().Session().client('polly', region_name=region)
+                # Drop clients signed with superseded credentials for this region
+                for stale in [k for k in _POLLY_CLIENTS if k[0] == region]:
+                    del _POLLY_CLIENTS[stale]
+                _POLLY_CLIENTS[key] = client
+    return client
+
+
+def _prewarm_boto3() -> None:
+    try:
+        _import_boto3()
+    except ImportError:
+        pass
 
 
 class PollyEngine(TTSEngine):
@@ -22,10 +146,7 @@ class PollyEngine(TTSEngine):
     """
 
     # Available Chinese voices (AWS Polly)
-    VOICES = [
-        {'value': 'Zhiyu-Neural', 'label': 'Zhiyu (Female - Neural)'},
-        {'value': 'Zhiyu-Standard', 'label': 'Zhiyu (Female - Standard)'},
-    ]
+    VOICES = POLLY_VOICES
 
     # Engine types
     ENGINE_TYPES = ['neural', 'standard']
@@ -38,37 +159,15 @@ class PollyEngine(TTSEngine):
         self._speed_normal = 1.0
         self._speed_name = 0.9
         self._region = os.getenv('AWS_REGION', 'us-east-1')
-        print(f"[PollyEngine] Initialized (client will be created on first use, region: {self._region})")
+        # Import boto3 in the background so the first synthesis doesn't pay for it
+        threading.Thread(target=_prewarm_boto3, name='boto3-prewarm', daemon=True).start()
+        logger.info(f"[PollyEngine] Initialized (client will be created on first use, region: {self._region})")
 
     def _ensure_client(self):
         """Create boto3 Polly client only once."""
         if self._client is None:
-            print(f"[PollyEngine] Creating boto3 Polly client (region: {self._region})...")
-            import boto3
-            self._client = boto3.client(
-                'polly',
-                region_name=self._region
-            )
-            print("[PollyEngine] Client created successfully")
-
-    def _pcm_to_wav(self, pcm_data: bytes, sample_rate: int = 24000) -> io.BytesIO:
-        """Convert raw PCM data to WAV format.
-
-        Args:
-            pcm_data: Raw PCM audio data (16-bit signed, mono)
-            sample_rate: Sample rate in Hz
-
-        Returns:
-            BytesIO buffer containing WAV audio data
-        """
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(pcm_data)
-        wav_buffer.seek(0)
-        return wav_buffer
+            self._client = _get_polly_client(self._region)
+            logger.debug(f"[PollyEngine] Client ready (region: {self._region})")
 
     def generate_audio(self, text: str, voice: str, speed: float) -> io.BytesIO:
         """Generate audio using AWS Polly API.
@@ -87,18 +186,19 @@ class PollyEngine(TTSEngine):
         self._ensure_client()
 
         # Convert speed multiplier to SSML prosody rate percentage
-        # Kokoro uses 0.3-2.0, Polly uses 20%-200%
-        rate_percent = max(20, min(200, int(speed * 100)))
+        rate_percent = _prosody_rate(speed)
 
-        # Wrap text in SSML with prosody for speed control
-        ssml_text = f'<speak><prosody rate="{rate_percent}%">{text}</prosody></speak>'
+        # Plain text at normal speed; otherwise wrap (escaped) text in SSML prosody for speed control
+        if rate_percent == 100:
+            request_text, text_type = text, 'text'
+        else:
+            pair = _SSML_CACHE.get(rate_percent)
+            if pair is None:
+                pair = _SSML_CACHE[rate_percent] = (f'<speak><prosody rate="{rate_percent}%">', '</prosody></speak>')
+            request_text = pair[0] + _xml_escape(text) + pair[1]
+            text_type = 'ssml'
 
-        # Parse engine type if encoded in voice string (e.g., 'Zhiyu-Neural')
-        actual_voice = voice
-        actual_engine = self._engine_type
-        if '-' in voice:
-            actual_voice, engine_suffix = voice.split('-', 1)
-            actual_engine = engine_suffix.lower()
+        actual_voice, actual_engine = self._resolve_voice(voice)
 
         # For PCM output format, AWS Polly only supports 8000 or 16000 Hz.
         # Higher rates like 22050 or 24000 are NOT supported for PCM.
@@ -106,8 +206,8 @@ class PollyEngine(TTSEngine):
 
         try:
             response = self._client.synthesize_speech(
-                Text=ssml_text,
-                TextType='ssml',
+                Text=request_text,
+                TextType=text_type,
                 OutputFormat='pcm',
                 VoiceId=actual_voice,
                 Engine=actual_engine,
@@ -115,21 +215,21 @@ class PollyEngine(TTSEngine):
                 LanguageCode='cmn-CN'  # Mandarin Chinese
             )
 
-            # Read PCM data from response
-            pcm_data = response['AudioStream'].read()
-
-            # Convert PCM to WAV
-            wav_buffer = self._pcm_to_wav(pcm_data, sample_rate=int(sample_rate))
-
-            return wav_buffer
+            # Stream PCM from the response directly into the WAV buffer
+            return _stream_to_wav(response['AudioStream'], int(sample_rate))
 
         except Exception as e:
-            print(f"[PollyEngine] Error generating audio: {e}")
+            logger.error(f"[PollyEngine] Error generating audio: {e}")
             raise
 
-    def get_available_voices(self) -> List[Dict[str, str]]:
+    def get_available_voices(self) -> Sequence[Dict[str, str]]:
         """Return list of available Polly voices for Chinese."""
-        return self.VOICES.copy()
+        return self.VOICES
+
+    def _resolve_voice(self, voice: str) -> Tuple[str, str]:
+        """Return (VoiceId, Engine) for a voice string, parsing a suffix like 'Zhiyu-Neural'."""
+        base_voice, engine = _parse_voice(voice)
+        return base_voice, engine or self._engine_type
 
     def update_config(self, voice: str, speed_normal: float, speed_name: float) -> None:
         """Update voice/speed config.
@@ -137,13 +237,13 @@ class PollyEngine(TTSEngine):
         If voice contains engine type (e.g. 'Zhiyu-Neural'), we split it.
         """
         self._voice = voice
-        if '-' in voice:
-            _, engine_suffix = voice.split('-', 1)
-            self._engine_type = engine_suffix.lower()
-            
+        engine = _parse_voice(voice)[1]
+        if engine is not None:
+            self._engine_type = engine
+
         self._speed_normal = speed_normal
         self._speed_name = speed_name
-        print(f"[PollyEngine] Config updated - Voice: {voice}, Engine: {self._engine_type}, Speed: {speed_normal}/{speed_name}")
+        logger.debug(f"[PollyEngine] Config updated - Voice: {voice}, Engine: {self._engine_type}, Speed: {speed_normal}/{speed_name}")
 
     def set_engine_type(self, engine_type: str) -> None:
         """Set the Polly engine type (neural or standard).
@@ -154,40 +254,32 @@ class PollyEngine(TTSEngine):
         if engine_type not in self.ENGINE_TYPES:
             raise ValueError(f"Invalid engine type: {engine_type}. Must be one of {self.ENGINE_TYPES}")
         self._engine_type = engine_type
-        print(f"[PollyEngine] Engine type set to: {engine_type}")
+        logger.debug(f"[PollyEngine] Engine type set to: {engine_type}")
 
     def dispose(self) -> None:
-        """Clean up boto3 client.
+        """Release this engine's reference to the boto3 client.
 
-        boto3 clients don't hold resources that need explicit cleanup,
-        but we set to None for consistency.
+        The client itself stays in the module-level pool so switching back
+        to Polly reuses it instead of rebuilding it.
         """
         if self._client is not None:
-            print("[PollyEngine] Disposing client...")
+            logger.info("[PollyEngine] Disposing client...")
             self._client = None
-            print("[PollyEngine] Client disposed")
+            logger.info("[PollyEngine] Client disposed")
         else:
-            print("[PollyEngine] No client to dispose")
+            logger.debug("[PollyEngine] No client to dispose")
 
     def get_engine_name(self) -> str:
         """Return engine display name."""
         return "AWS Polly"
 
     def is_available(self) -> bool:
-        """Check if AWS Polly is available (credentials configured)."""
-        # Check for AWS credentials
-        access_key = os.getenv('AWS_ACCESS_KEY_ID')
-        secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
+        """Check if AWS Polly is available (credentials configured, boto3 installed).
 
-        if not access_key or not secret_key:
-            return False
-
-        # Optionally verify credentials work by making a test call
-        try:
-            import boto3
-            return True
-        except ImportError:
-            return False
+        Uses the memoized find_spec probe so the check never pays for importing boto3.
+        """
+        return (bool(os.getenv('AWS_ACCESS_KEY_ID')) and bool(os.getenv('AWS_SECRET_ACCESS_KEY'))
+                and _has_module('boto3'))
 
     @property
     def voice(self) -> str: